@@ -28,6 +28,7 @@ from app.schemas.property import (
     LastPriceChange,
 )
 from app.scrapers import ArgenpropScraper, ZonapropScraper, RemaxScraper, MercadoLibreScraper
+from app.scrapers.http_client import open_async_session
 from app.services.geocoding import geocoding_service
 from app.services.address import normalize_address_fields
 from app.api.deps import get_current_user
@@ -872,6 +873,8 @@ async def update_all_prices(
     Update prices for all properties from their source URLs.
     Creates price history entries when prices change.
     """
+    # One keep-alive session for every listing of this run
+    http_session = open_async_session()
     try:
         # Get all properties with source URLs
         stmt = select(Property).where(Property.source_url.isnot(None))
@@ -886,23 +889,19 @@ async def update_all_prices(
         error_count = 0
         price_changes = []
 
-        for property_obj in properties:
+        # Scrape only to get current price and status (30s timeout per property).
+        # Fetches run concurrently; the DB updates below stay sequential.
+        scrape_results = await _scrape_concurrently(
+            [p.source_url for p in properties], http_session, timeout=30.0
+        )
+
+        for property_obj, scraped_data in zip(properties, scrape_results):
             try:
-                # Determine scraper based on source URL
-                scraper = None
-                if "argenprop.com" in property_obj.source_url:
-                    scraper = ArgenpropScraper(property_obj.source_url)
-                elif "zonaprop.com" in property_obj.source_url:
-                    scraper = ZonapropScraper(property_obj.source_url)
-                elif "remax.com" in property_obj.source_url:
-                    scraper = RemaxScraper(property_obj.source_url)
-                elif "mercadolibre.com" in property_obj.source_url:
-                    scraper = MercadoLibreScraper(property_obj.source_url)
-                else:
+                if not _is_bulk_portal(property_obj.source_url):
                     continue
+                if isinstance(scraped_data, BaseException):
+                    raise scraped_data
 
-                # Scrape only to get current price and status (30s timeout per property)
-                scraped_data = await asyncio.wait_for(scraper.scrape(), timeout=30.0)
                 new_price = scraped_data.get('price')
                 new_currency_str = scraped_data.get('currency', 'USD')
                 new_status = scraped_data.get('status', 'active')
@@ -977,6 +976,9 @@ async def update_all_prices(
             'success': False,
             'message': f'Error al actualizar precios: {str(e)}',
         }
+    finally:
+        if http_session is not None:
+            await http_session.close()
 
 
 PORTAL_DOMAINS = {
@@ -996,6 +998,8 @@ async def rescrape_all_properties(
     Re-scrape all properties from their source URLs.
     Updates all property data while preserving manually edited fields.
     """
+    # One keep-alive session for every listing of this run
+    http_session = open_async_session()
     try:
         # Get all properties with source URLs
         stmt = select(Property).where(Property.source_url.isnot(None))
@@ -1013,29 +1017,23 @@ async def rescrape_all_properties(
         error_count = 0
         errors = []
 
-        for prop_id, source_url, prop_title in property_rows:
+        # Full scrape (30s timeout per property). Fetches run concurrently; the
+        # DB updates below stay sequential on this request's session.
+        scrape_results = await _scrape_concurrently(
+            [source_url for _, source_url, _ in property_rows], http_session, timeout=30.0
+        )
+
+        for (prop_id, source_url, prop_title), scraped_data in zip(property_rows, scrape_results):
             try:
+                if not _is_bulk_portal(source_url):
+                    continue
                 # Re-fetch a fresh ORM object for this iteration
                 prop_result = await db.execute(select(Property).where(Property.id == prop_id))
                 property_obj = prop_result.scalar_one_or_none()
                 if not property_obj:
                     continue
-
-                # Determine scraper based on source URL (use the plain str, not the ORM attr)
-                scraper = None
-                if "argenprop.com" in source_url:
-                    scraper = ArgenpropScraper(source_url)
-                elif "zonaprop.com" in source_url:
-                    scraper = ZonapropScraper(source_url)
-                elif "remax.com" in source_url:
-                    scraper = RemaxScraper(source_url)
-                elif "mercadolibre.com" in source_url:
-                    scraper = MercadoLibreScraper(source_url)
-                else:
-                    continue
-
-                # Full scrape (30s timeout per property)
-                scraped_data = await asyncio.wait_for(scraper.scrape(), timeout=30.0)
+                if isinstance(scraped_data, BaseException):
+                    raise scraped_data
 
                 if not scraped_data:
                     error_count += 1
@@ -1166,6 +1164,9 @@ async def rescrape_all_properties(
             'success': False,
             'message': f'Error al re-scrapear propiedades: {str(e)}',
         }
+    finally:
+        if http_session is not None:
+            await http_session.close()
 
 
 # Helper functions
@@ -1182,6 +1183,62 @@ def _parse_status(status_str: str) -> PropertyStatus:
     return status_map.get(status_str.lower(), PropertyStatus.ACTIVE)
 
 
+# Listings scraped at once by the bulk endpoints. Fetches are I/O-bound, so a
+# few in flight cut a bulk run roughly by this factor; kept low so one portal
+# does not see a burst from a single request. Browser fallbacks are capped
+# separately per process (MercadoLibre's driver pool, Zonaprop's
+# SELENIUM_MAX_BROWSERS), since a timed-out scrape's worker thread keeps its
+# Chrome running until it finishes.
+BULK_SCRAPE_CONCURRENCY = 4
+
+
+def _is_bulk_portal(source_url: str) -> bool:
+    """True when _bulk_scraper has a scraper for the listing URL"""
+    return any(domain in source_url for domain in PORTAL_DOMAINS.values())
+
+
+def _bulk_scraper(source_url: str, http_session):
+    """Scraper for a stored listing URL sharing the run's HTTP session, or None for unknown portals"""
+    if "argenprop.com" in source_url:
+        return ArgenpropScraper(source_url, session=http_session)
+    if "zonaprop.com" in source_url:
+        return ZonapropScraper(source_url, session=http_session)
+    if "remax.com" in source_url:
+        return RemaxScraper(source_url, session=http_session)
+    if "mercadolibre.com" in source_url:
+        # Bulk runs exist to pick up current prices: never serve a cached scrape
+        return MercadoLibreScraper(source_url, session=http_session, use_cache=False)
+    return None
+
+
+async def _scrape_concurrently(source_urls: list, http_session, timeout: float) -> list:
+    """
+    Scrape each listing URL, at most BULK_SCRAPE_CONCURRENCY at a time.
+
+    Each scraper is built inside its task and dropped when the task ends, so
+    its soup and parse caches are freed as soon as the listing is done rather
+    than living until the caller's DB loop finishes.
+
+    Returns one entry per URL, in order: the scraped dict, the exception the
+    scrape raised (timeouts included), or None for unknown portals.
+    """
+    semaphore = asyncio.Semaphore(BULK_SCRAPE_CONCURRENCY)
+
+    async def _scrape(source_url):
+        # Timeout starts once a slot is free, not while queued
+        async with semaphore:
+            scraper = _bulk_scraper(source_url, http_session)
+            if scraper is None:
+                return None
+            try:
+                return await asyncio.wait_for(scraper.scrape(), timeout=timeout)
+            except Exception as e:
+                # The traceback's frames would keep the scraper (and its soup) alive
+                return e.with_traceback(None)
+
+    return await asyncio.gather(*(_scrape(url) for url in source_urls), return_exceptions=True)
+
+
 def _scraped_to_property(scraped_data: dict, user_id: UUID) -> dict:
     """Convert scraped data to Property model format"""
     location_data = scraped_data.get('location', {})
@@ -14,6 +14,8 @@ class ArgenpropScraper(BaseScraper):
 
     DOMAIN = "argenprop.com"
 
+    __slots__ = ()
+
     def validate_url(self) -> bool:
         """Check if URL is from Argenprop"""
         parsed = urlparse(self.url)
@@ -410,10 +412,12 @@ class ArgenpropScraper(BaseScraper):
 
     def _extract_images(self) -> List[str]:
         """Extract image URLs with multiple strategies"""
-        images = []
+        # Insertion-ordered dict as an ordered set: dedups as it goes, so
+        # collection can stop as soon as the 20 kept images are known
+        images: Dict[str, None] = {}
 
         if not self.soup:
-            return images
+            return []
 
         # Strategy 1: Check multiple image attributes
         image_attrs = ['src', 'data-src', 'data-original', 'data-lazy', 'data-lazy-src']
@@ -428,6 +432,8 @@ class ArgenpropScraper(BaseScraper):
         ]
 
         for selector in selectors:
+            if len(images) >= 20:
+                break
             imgs = self.soup.select(selector)
             for img in imgs:
                 # Try all possible image attributes
@@ -436,9 +442,12 @@ class ArgenpropScraper(BaseScraper):
                     if img_url:
                         normalized = self._normalize_image_url(img_url)
                         if normalized:
-                            images.append(normalized)
+                            images[normalized] = None
                         break  # Found image, move to next img tag
 
+        if len(images) >= 20:
+            return list(images)[:20]
+
         # Strategy 2: Check picture/source tags
         pictures = self.soup.select('picture source')
         for source in pictures:
@@ -448,7 +457,7 @@ class ArgenpropScraper(BaseScraper):
                 first_url = srcset.split(',')[0].strip().split(' ')[0]
                 normalized = self._normalize_image_url(first_url)
                 if normalized:
-                    images.append(normalized)
+                    images[normalized] = None
 
         # Strategy 3: Look for JSON-LD or schema.org data with images
         scripts = self.soup.find_all('script', type='application/ld+json')
@@ -463,23 +472,15 @@ class ArgenpropScraper(BaseScraper):
                             for img_url in img_data:
                                 normalized = self._normalize_image_url(img_url)
                                 if normalized:
-                                    images.append(normalized)
+                                    images[normalized] = None
                         elif isinstance(img_data, str):
                             normalized = self._normalize_image_url(img_data)
                             if normalized:
-                                images.append(normalized)
+                                images[normalized] = None
             except (json.JSONDecodeError, AttributeError):
                 continue
 
-        # Remove duplicates while preserving order
-        seen = set()
-        unique_images = []
-        for img in images:
-            if img not in seen:
-                seen.add(img)
-                unique_images.append(img)
-
-        return unique_images[:20]  # Limit to 20 images
+        return list(images)[:20]  # Limit to 20 images
 
     def _extract_features(self) -> Dict[str, Any]:
         """Extract property features"""
@@ -7,21 +7,29 @@ from typing import Optional, Dict, Any, List
 from urllib.parse import urlparse
 from bs4 import BeautifulSoup
 from .http_client import fetch_with_browser_fingerprint
+from .utils import HTML_PARSER
 
 
 class BaseScraper(ABC):
     """Base class for all property scrapers"""
 
-    def __init__(self, url: str, user_agent: Optional[str] = None):
+    # Scrapers are created per listing (many per bulk re-scrape), so subclasses
+    # declare __slots__ too and skip the per-instance __dict__
+    __slots__ = ('url', 'user_agent', 'session', 'soup')
+
+    def __init__(self, url: str, user_agent: Optional[str] = None, session=None):
         """
         Initialize scraper
 
         Args:
             url: Property URL to scrape
             user_agent: Optional custom user agent
+            session: Optional curl_cffi AsyncSession shared by the caller across
+                listings (see open_async_session); the caller closes it
         """
         self.url = url
         self.user_agent = user_agent or "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+        self.session = session
         self.soup: Optional[BeautifulSoup] = None
 
     @abstractmethod
@@ -54,18 +62,23 @@ class BaseScraper(ABC):
         Returns:
             HTML content as string
         """
-        return await fetch_with_browser_fingerprint(self.url, user_agent=self.user_agent)
+        return await fetch_with_browser_fingerprint(
+            self.url, user_agent=self.user_agent, session=self.session
+        )
 
     def parse_html(self, html: str) -> None:
         """
-        Parse HTML content with BeautifulSoup.
+        Parse HTML content with BeautifulSoup, using the lxml tree builder
+        when it is installed (several times faster on large product pages).
 
         Args:
             html: HTML content string (already decoded Unicode)
         """
         # Don't pass from_encoding when html is already a string (Unicode)
-        # from_encoding is only for bytes input
-        self.soup = BeautifulSoup(html, 'html.parser')
+        # from_encoding is only for bytes input. Handing lxml the raw bytes
+        # instead is not faster (measured within noise on an 800 KB page) and
+        # would move charset sniffing from http_client into the parser.
+        self.soup = BeautifulSoup(html, HTML_PARSER)
 
     async def scrape(self) -> Dict[str, Any]:
         """
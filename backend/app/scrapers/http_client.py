@@ -8,13 +8,13 @@ This module is the single source of truth for HTTP fetching across all scrapers.
 """
 import asyncio
 import logging
-from typing import Optional
+from typing import Callable, Optional
 
 logger = logging.getLogger(__name__)
 
 # Try to import curl_cffi (preferred for Cloudflare bypass)
 try:
-    from curl_cffi import requests as curl_requests
+    from curl_cffi import CurlHttpVersion, requests as curl_requests
     HAS_CURL_CFFI = True
 except ImportError:
     HAS_CURL_CFFI = False
@@ -40,7 +40,6 @@ BROWSER_HEADERS = {
     "Sec-Fetch-Site": "none",
     "Sec-Fetch-User": "?1",
     "Upgrade-Insecure-Requests": "1",
-    "Connection": "keep-alive",
     "Priority": "u=0, i",
 }
 
@@ -72,6 +71,8 @@ async def fetch_with_browser_fingerprint(
     user_agent: Optional[str] = None,
     timeout: float = 30.0,
     max_retries: int = 2,
+    session=None,
+    is_usable: Optional[Callable[[str], bool]] = None,
 ) -> str:
     """
     Fetch a URL using browser TLS fingerprint impersonation.
@@ -88,6 +89,10 @@ async def fetch_with_browser_fingerprint(
         user_agent: Optional custom User-Agent string
         timeout: Request timeout in seconds
         max_retries: Maximum retry attempts for transient errors
+        session: Optional shared curl_cffi AsyncSession (see open_async_session),
+            tried before the per-request impersonation profiles
+        is_usable: Optional portal-specific page check that replaces the shared
+            CF_BLOCK_MARKERS test for curl_cffi responses (True = accept the page)
 
     Returns:
         HTML content as string
@@ -101,7 +106,7 @@ async def fetch_with_browser_fingerprint(
 
     for attempt in range(1, max_retries + 1):
         try:
-            return await _fetch_once(url, headers, timeout)
+            return await _fetch_once(url, headers, timeout, session, is_usable)
         except Exception as e:
             last_exception = e
             # Only retry on transient errors (connection, timeout)
@@ -120,45 +125,103 @@ async def fetch_with_browser_fingerprint(
     raise last_exception  # type: ignore[misc]
 
 
+def open_async_session():
+    """
+    Create a curl_cffi AsyncSession to share across a scraper run.
+
+    Reusing one session keeps TLS connections (and cookies) warm between
+    pages. HTTP/2 is requested explicitly so concurrent page fetches to the
+    same host are multiplexed as streams over a single connection; the caller
+    must `await session.close()`. Returns None when curl_cffi is not installed.
+    """
+    if not HAS_CURL_CFFI:
+        return None
+    return curl_requests.AsyncSession(impersonate="chrome", http_version=CurlHttpVersion.V2TLS)
+
+
+def _html_from_curl_response(
+    response,
+    url: str,
+    profile: str,
+    is_usable: Optional[Callable[[str], bool]] = None,
+) -> Optional[str]:
+    """Decoded HTML of a usable curl_cffi response, None (logged) otherwise."""
+    if response.status_code == 200 and len(response.content) > 1000:
+        html = _decode_content(response.content)
+        usable = is_usable(html) if is_usable is not None else not _is_cf_blocked(html)
+        if usable:
+            logger.debug(
+                f"curl_cffi OK for {url} "
+                f"(profile={profile}, http={response.http_version}, len={len(html)})"
+            )
+            return html
+        logger.warning(f"curl_cffi got Cloudflare challenge for {url} (profile={profile})")
+    else:
+        logger.warning(
+            f"curl_cffi response for {url}: "
+            f"status={response.status_code}, len={len(response.content)} (profile={profile})"
+        )
+    return None
+
+
+def _fetch_curl_cffi(
+    url: str,
+    headers: dict,
+    timeout: float,
+    is_usable: Optional[Callable[[str], bool]] = None,
+) -> Optional[str]:
+    """Try each curl_cffi impersonation profile; return HTML or None (blocking)."""
+    # Try multiple impersonation profiles — different Cloudflare configs block different fingerprints
+    impersonate_profiles = ["chrome", "chrome124", "chrome110", "edge101"]
+    for profile in impersonate_profiles:
+        session = None
+        try:
+            # Use a Session to persist cookies across redirects (helps with CF cookie challenges)
+            session = curl_requests.Session(impersonate=profile)
+            response = session.get(
+                url,
+                headers=headers,
+                timeout=timeout,
+                allow_redirects=True,
+            )
+            html = _html_from_curl_response(response, url, profile, is_usable)
+            if html is not None:
+                return html
+        except Exception as e:
+            logger.warning(f"curl_cffi failed for {url} (profile={profile}): {e}")
+        finally:
+            try:
+                if session is not None:
+                    session.close()
+            except Exception:
+                pass
+    return None
+
+
 async def _fetch_once(
     url: str,
     headers: dict,
     timeout: float,
+    session=None,
+    is_usable: Optional[Callable[[str], bool]] = None,
 ) -> str:
     """Single fetch attempt with curl_cffi -> httpx fallback chain."""
-    # Method 1: curl_cffi with Chrome TLS fingerprint
-    # Try multiple impersonation profiles — different Cloudflare configs block different fingerprints
+    # Method 0: the caller's shared AsyncSession (warm connection, no new handshake)
+    if HAS_CURL_CFFI and session is not None:
+        try:
+            response = await session.get(url, headers=headers, timeout=timeout, allow_redirects=True)
+            html = _html_from_curl_response(response, url, "shared", is_usable)
+            if html is not None:
+                return html
+        except Exception as e:
+            logger.warning(f"curl_cffi shared session failed for {url}: {e}")
+
+    # Method 1: curl_cffi with Chrome TLS fingerprint, rotating profiles
+    # (blocking client, so it runs in a worker thread to keep the event loop free)
     if HAS_CURL_CFFI:
-        impersonate_profiles = ["chrome", "chrome124", "chrome110", "edge101"]
-        for profile in impersonate_profiles:
-            try:
-                # Use a Session to persist cookies across redirects (helps with CF cookie challenges)
-                session = curl_requests.Session(impersonate=profile)
-                response = session.get(
-                    url,
-                    headers=headers,
-                    timeout=timeout,
-                    allow_redirects=True,
-                )
-                if response.status_code == 200 and len(response.content) > 1000:
-                    html = _decode_content(response.content)
-                    if not _is_cf_blocked(html):
-                        logger.debug(f"curl_cffi OK for {url} (profile={profile}, len={len(html)})")
-                        return html
-                    else:
-                        logger.warning(f"curl_cffi got Cloudflare challenge for {url} (profile={profile})")
-                else:
-                    logger.warning(
-                        f"curl_cffi response for {url}: "
-                        f"status={response.status_code}, len={len(response.content)} (profile={profile})"
-                    )
-            except Exception as e:
-                logger.warning(f"curl_cffi failed for {url} (profile={profile}): {e}")
-            finally:
-                try:
-                    session.close()
-                except Exception:
-                    pass
+        html = await asyncio.to_thread(_fetch_curl_cffi, url, headers, timeout, is_usable)
+        if html is not None:
+            return html
 
     # Method 2: httpx fallback (works for non-CF sites)
     import httpx
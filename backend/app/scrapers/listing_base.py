@@ -4,14 +4,19 @@ For scraping search result pages (listings) to extract property URLs
 """
 import asyncio
 import logging
+import math
 from abc import ABC, abstractmethod
 from typing import Optional, Dict, Any, List
+from urllib.parse import urlparse
 from bs4 import BeautifulSoup
 from .http_client import fetch_with_browser_fingerprint
-from .utils import clean_price as _shared_clean_price
+from .utils import DomainRateLimiter, clean_price as _shared_clean_price
 
 logger = logging.getLogger(__name__)
 
+# Paces result-page requests per portal domain, across all scraper instances
+page_rate_limiter = DomainRateLimiter()
+
 # Default user agent
 DEFAULT_USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36"
 
@@ -24,11 +29,15 @@ class BaseListingScraper(ABC):
     this scrapes search result pages to extract multiple property URLs.
     """
 
+    # Subclasses may declare their own __slots__; those that don't keep a __dict__
+    __slots__ = ('search_params', 'user_agent', 'soup', '_http_session')
+
     # Subclasses should override these
     PORTAL_NAME = "base"
     BASE_URL = ""
     MAX_PAGES = 10  # Maximum pages to scrape to prevent infinite loops
-    DELAY_BETWEEN_PAGES = 2.0  # Seconds between page requests
+    DELAY_BETWEEN_PAGES = 2.0  # Min seconds between page requests to the portal (grows on failures)
+    MAX_CONCURRENT_PAGES = 1  # >1: once page 1 gives the total, fetch pages 2..N in parallel
 
     def __init__(
         self,
@@ -58,6 +67,8 @@ class BaseListingScraper(ABC):
         self.search_params = search_params
         self.user_agent = user_agent or DEFAULT_USER_AGENT
         self.soup: Optional[BeautifulSoup] = None
+        # Shared curl_cffi AsyncSession for a scrape run (None: per-request sessions)
+        self._http_session = None
 
     @abstractmethod
     def build_search_url(self, page: int = 1) -> str:
@@ -101,6 +112,15 @@ class BaseListingScraper(ABC):
         """
         pass
 
+    def get_total_results(self) -> Optional[int]:
+        """
+        Total number of results reported by the current page, if shown.
+
+        Returns:
+            Result count, or None when the portal doesn't expose it
+        """
+        return None
+
     async def fetch_page(self, url: str) -> str:
         """
         Fetch the HTML content of a page.
@@ -117,7 +137,9 @@ class BaseListingScraper(ABC):
         Raises:
             Exception: If all fetch methods fail
         """
-        return await fetch_with_browser_fingerprint(url, user_agent=self.user_agent)
+        return await fetch_with_browser_fingerprint(
+            url, user_agent=self.user_agent, session=self._http_session,
+        )
 
     def parse_html(self, html: str) -> None:
         """
@@ -143,14 +165,23 @@ class BaseListingScraper(ABC):
         url = self.build_search_url(page)
         logger.debug(f"[{self.PORTAL_NAME}] Scraping page {page}: {url}")
 
+        # Waits only for what is left of the interval since the last request
+        domain = urlparse(url).netloc
+        await page_rate_limiter.acquire(domain, self.DELAY_BETWEEN_PAGES)
+
+        html = None
         try:
             html = await self.fetch_page(url)
+            page_rate_limiter.ok(domain)
             logger.debug(f"[{self.PORTAL_NAME}] Fetched HTML, length: {len(html)}")
             self.parse_html(html)
             cards = self.extract_property_cards()
             logger.debug(f"[{self.PORTAL_NAME}] Found {len(cards)} properties on page {page}")
             return cards
         except Exception as e:
+            if html is None:
+                # The fetch itself failed: space out further requests
+                page_rate_limiter.back_off(domain)
             logger.debug(f"[{self.PORTAL_NAME}] Error scraping page {page}: {str(e)}")
             raise
 
@@ -183,8 +214,14 @@ class BaseListingScraper(ABC):
                     logger.info(f"[{self.PORTAL_NAME}] No next page, stopping")
                     break
 
-                # Rate limiting delay between pages
-                await asyncio.sleep(self.DELAY_BETWEEN_PAGES)
+                # Page 1 tells the page size and total: fetch the rest in parallel
+                if current_page == 1 and self.MAX_CONCURRENT_PAGES > 1 and len(all_properties) < max_properties:
+                    remaining = await self._scrape_remaining_pages(all_properties, max_properties)
+                    if remaining is not None:
+                        all_properties.extend(remaining)
+                        break
+
+                # Pacing between pages is handled by page_rate_limiter in scrape_page
                 current_page += 1
 
             except Exception as e:
@@ -196,6 +233,58 @@ class BaseListingScraper(ABC):
         logger.info(f"[{self.PORTAL_NAME}] Total properties scraped: {len(result)}")
         return result
 
+    async def _scrape_remaining_pages(
+        self,
+        first_page: List[Dict[str, Any]],
+        max_properties: int,
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Scrape pages 2..N concurrently (at most MAX_CONCURRENT_PAGES at a time).
+
+        Pages are still paced per domain by page_rate_limiter. Results are
+        merged in page order, deduplicated by source_url (listings can shift
+        between pages while they are being fetched), up to the first empty
+        page. Returns None when the total result count is unknown, so the
+        caller continues sequentially.
+
+        Args:
+            first_page: Cards from page 1
+            max_properties: Maximum number of properties to extract
+        """
+        total = self.get_total_results()
+        if not total:
+            return None
+
+        per_page = len(first_page)
+        last_page = min(
+            self.MAX_PAGES,
+            math.ceil(total / per_page),
+            math.ceil(max_properties / per_page),
+        )
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_PAGES)
+
+        async def _scrape(page: int) -> List[Dict[str, Any]]:
+            async with semaphore:
+                return await self.scrape_page(page)
+
+        pages = range(2, last_page + 1)
+        results = await asyncio.gather(*(_scrape(p) for p in pages), return_exceptions=True)
+
+        remaining: List[Dict[str, Any]] = []
+        seen_urls = {card.get('source_url') for card in first_page}
+        for page, cards in zip(pages, results):
+            if isinstance(cards, Exception):
+                logger.error(f"[{self.PORTAL_NAME}] Error on page {page}: {str(cards)}")
+                continue
+            if not cards:
+                logger.info(f"[{self.PORTAL_NAME}] No properties on page {page}, stopping")
+                break
+            for card in cards:
+                if card.get('source_url') not in seen_urls:
+                    seen_urls.add(card.get('source_url'))
+                    remaining.append(card)
+        return remaining
+
     # Helper methods for subclasses
 
     def extract_text(self, selector: str, default: str = "") -> str:
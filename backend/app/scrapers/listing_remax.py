@@ -460,8 +460,7 @@ class RemaxListingScraper(BaseListingScraper):
                 if not cards and self._last_raw_count > 0:
                     logger.info(f"[{self.PORTAL_NAME}] Page {current_page} had {self._last_raw_count} raw items but 0 matches. Deep scraping next page...")
 
-                # Rate limiting delay between pages
-                await asyncio.sleep(self.DELAY_BETWEEN_PAGES)
+                # Pacing between pages is handled by page_rate_limiter in scrape_page
                 current_page += 1
 
             except Exception as e:
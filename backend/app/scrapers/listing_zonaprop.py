@@ -4,16 +4,468 @@ Scrapes search result pages from www.zonaprop.com.ar to extract property URLs
 Uses curl_cffi for Cloudflare bypass, Selenium as last resort.
 """
 import asyncio
+import copy
+import json
+import os
+import random
 import re
 import logging
-from typing import Dict, Any, List, Optional
-from urllib.parse import urljoin, urlparse, urlunparse
-from bs4 import BeautifulSoup
-from .listing_base import BaseListingScraper
-from .http_client import fetch_with_browser_fingerprint
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from itertools import islice
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Tuple
+from urllib.parse import urlparse, urlunparse
+import soupsieve
+from bs4 import BeautifulSoup, NavigableString
+from .listing_base import BaseListingScraper, page_rate_limiter
+from .utils import BLOCKED_RESOURCE_URLS, HTML_PARSER, RateLimiter
+from .http_client import (
+    BROWSER_HEADERS,
+    HAS_CURL_CFFI,
+    _decode_content,
+    _is_cf_blocked,
+    fetch_with_browser_fingerprint,
+    open_async_session,
+)
+
+if HAS_CURL_CFFI:
+    from curl_cffi import requests as curl_requests
+
+try:
+    from lxml import etree as lxml_etree, html as lxml_html
+    HAS_LXML = True
+except ImportError:
+    HAS_LXML = False
 
 logger = logging.getLogger(__name__)
 
+# Property detail URLs end in "-<7+ digit id>.html"
+_RE_PROPERTY_ID = re.compile(r'-(\d{7,})\.html')
+
+# Fallback id: any long numeric run in the URL
+_RE_LONG_NUM = re.compile(r'(\d{7,})')
+
+# Search/listing pages, e.g. /departamentos-venta-capital-federal.html
+_LISTING_PREFIXES = (
+    'departamentos-', 'casas-', 'ph-', 'terrenos-', 'oficinas-', 'locales-', 'cocheras-',
+)
+
+
+def _is_listing_path(url: str) -> bool:
+    """True for search/listing page paths (optionally root-relative)."""
+    path = url[1:] if url[:1] == '/' else url
+    return path.startswith(_LISTING_PREFIXES)
+
+
+# Slug builder: accents are folded, then runs of anything that is not
+# [a-z0-9] become one hyphen
+_ACCENT_TABLE = str.maketrans({
+    'á': 'a', 'é': 'e', 'í': 'i', 'ó': 'o', 'ú': 'u',
+    'ñ': 'n', 'ü': 'u',
+})
+_RE_SLUG_NONALNUM = re.compile(r'[^a-z0-9]+')
+
+# Result counter, e.g. "1 - 20 de 1234"
+_RE_PAGING = re.compile(r'(\d+)\s*-\s*(\d+)\s*de\s*(\d+)')
+_RE_DIGITS = re.compile(r'(\d+)')
+
+# Card feature snippets: m², amb, baño, dorm, coch
+_RE_FEATURE_SNIPPET = re.compile(r'm[²2]|amb|bañ|dorm|coch', re.IGNORECASE)
+
+# Full-size gallery URLs in the detail page's embedded pictures JSON
+_RE_JSON_IMG = re.compile(r'"url1200x1200"\s*:\s*"(https://imgar\.zonapropcdn\.com/avisos/[^"]+)"')
+
+# Any listing image URL on the Zonaprop CDN (any size). The path stops at
+# entity (&quot;) and JSON-escape (\") terminators and must end in an image extension.
+_RE_ANY_IMG = re.compile(
+    r'https://[\w.-]*zonapropcdn\.com/avisos/[^"\'\s<>&\\]+?\.(?:jpe?g|png|webp)(?![\w.])',
+    re.IGNORECASE,
+)
+
+# Image URL segments rewritten by _upgrade_image_url: "/240x180/" or "/resize/N/"
+_RE_IMG_UPGRADE = re.compile(r'/(?:resize/(\d+)|\d+x\d+)(?=/)')
+
+
+def _upgrade_match(match: re.Match) -> str:
+    """Replacement for _RE_IMG_UPGRADE (trailing slash is kept by the lookahead)."""
+    return f'/{match.group(1)}' if match.group(1) else '/1200x1200'
+
+
+# Detail page gallery images
+_GALLERY_IMG_SELECTOR = ', '.join([
+    '#multimedia-content img',
+    '#new-gallery-portal img',
+    '.gallery-multimedia-represh img',
+    '.item-desktop img',
+])
+
+# Detail page feature patterns (matched against lowercased text)
+_RE_AMBIENTES = re.compile(r'(\d+)\s*ambiente')
+_RE_COCHERAS = re.compile(r'(\d+)\s*cochera')
+_RE_AREA = re.compile(r'(\d+)\s*m')
+_RE_ICON_FEATURE = re.compile(r'(\d+)\s*(m[²2]\s*tot|m[²2]\s*cub|baño|dormitorio)')
+
+# Detail page address heading: "Street 123, Neighborhood, City"
+_RE_LOCATION = re.compile(r'capital federal|buenos aires|,', re.I)
+
+
+def _is_location_h4(tag) -> bool:
+    return tag.name == 'h4' and _RE_LOCATION.search(tag.get_text(strip=True)) is not None
+
+
+# Substring only a rendered results page contains (posting cards)
+_RESULTS_PAGE_MARKER = 'data-qa="posting'
+
+# Challenge markers of Zonaprop's current Cloudflare pages (Turnstile widget,
+# challenge-platform scripts), checked on results pages on top of CF_BLOCK_MARKERS
+_ZONAPROP_CF_MARKERS = ('cf-turnstile', '__cf_chl_')
+
+# Present once a results page has rendered its cards (no generic links:
+# those exist before the listing is populated)
+_RESULT_CARD_READY_SELECTOR = 'div[data-qa="posting PROPERTY"], div.postingCard, div[class*="PostingCard"]'
+
+# Present once a detail page has rendered its title or gallery
+_DETAIL_READY_SELECTOR = 'h2.title-type-sup-property, #multimedia-content img'
+
+
+class _PrioritySelector:
+    """Ordered CSS selector fallbacks resolved with a single tree walk.
+
+    The selectors are OR-ed into one compiled query; the (few) matches are
+    then ranked by which selector they satisfy, so results are the same as
+    trying each selector in turn.
+    """
+
+    __slots__ = ('_combined', '_parts')
+
+    def __init__(self, *selectors: str):
+        self._combined = soupsieve.compile(', '.join(selectors))
+        self._parts = tuple(soupsieve.compile(sel) for sel in selectors)
+
+    def firsts(self, root):
+        """Yield the first match of each selector under root, in priority order."""
+        candidates = self._combined.select(root)
+        if not candidates:
+            return
+        for part in self._parts:
+            for el in candidates:
+                if part.match(el):
+                    yield el
+                    break
+
+    def select_one(self, root):
+        return next(self.firsts(root), None)
+
+    def first_of_each(self, root) -> list:
+        """First match (or None) of every selector, in declaration order."""
+        candidates = self._combined.select(root)
+        return [
+            next((el for el in candidates if part.match(el)), None)
+            for part in self._parts
+        ]
+
+    def select(self, root) -> list:
+        """All matches of the highest-priority selector that matches anything."""
+        candidates = self._combined.select(root)
+        for part in self._parts:
+            matched = [el for el in candidates if part.match(el)]
+            if matched:
+                return matched
+        return []
+
+
+# Search result cards and their fields, most specific selector first
+_CARD_SELECTOR = _PrioritySelector(
+    'div[data-qa="posting PROPERTY"]',
+    'div.postingCard',
+    'div[class*="PostingCard"]',
+    'article[data-posting-type]',
+    'div[class*="posting-card"]',
+    '[data-qa="posting"]',
+)
+_CARD_TITLE_SELECTOR = _PrioritySelector(
+    '[data-qa="POSTING_CARD_TITLE"]',
+    '[data-qa="POSTING_CARD_LOCATION"]',
+    'h2',
+    'h3',
+    '[class*="title"]',
+    '[class*="Title"]',
+)
+_CARD_PRICE_SELECTOR = _PrioritySelector(
+    '[data-qa="POSTING_CARD_PRICE"]',
+    '[class*="Price"]',
+    '[class*="price"]',
+)
+_CARD_IMG_SELECTOR = _PrioritySelector(
+    'img[data-qa]',
+    'img[class*="image"]',
+    'img[class*="Image"]',
+    'img',
+)
+_CARD_LOCATION_SELECTOR = _PrioritySelector(
+    '[data-qa="POSTING_CARD_LOCATION"]',
+    '[class*="Location"]',
+    '[class*="location"]',
+    '[class*="address"]',
+)
+_CARD_DESCRIPTION_SELECTOR = _PrioritySelector(
+    '[data-qa="POSTING_CARD_DESCRIPTION"]',
+    '[class*="Description"]',
+    '[class*="description"]',
+    '[class*="subtitle"]',
+)
+_CARD_ADDRESS_SELECTOR = _PrioritySelector(
+    '[data-qa="POSTING_CARD_ADDRESS"]',
+    '[class*="Address"]',
+    '[class*="address"]',
+)
+_CARD_FEATURES_SELECTOR = _PrioritySelector(
+    '[data-qa="POSTING_CARD_FEATURES"]',
+    '[class*="PostingMainFeatures"]',
+    '[class*="postingMainFeatures"]',
+    '[class*="main-features"]',
+    '[class*="CardFeatures"]',
+    '[class*="posting-features"]',
+)
+
+# Any of these marks a "next page" link in the results pagination
+_PAGINATION_NEXT_SELECTOR = ', '.join([
+    'a[data-qa="PAGING_NEXT"]',
+    'a[href*="pagina="]',
+    '.pagination a.next',
+    '.pagination__next',
+    'a[rel="next"]',
+    'li.next a',
+])
+
+# Next-page link plus the result-counter candidates, resolved in one walk
+_PAGE_INFO_SELECTOR = _PrioritySelector(
+    _PAGINATION_NEXT_SELECTOR,
+    '[data-qa="SEARCH_RESULTS_COUNT"]',
+    '.results-count',
+    '[class*="ResultCount"]',
+    '[class*="result-count"]',
+)
+
+# Elements of a results page the extractors read: cards, counters and
+# pagination (all matches of the selectors above) plus every link for the
+# no-cards fallback. Everything else (filler markup, nav, footer) is skipped
+# before BeautifulSoup builds its tree.
+_RESULTS_PAGE_XPATH = (
+    "//*[@data-qa] | //article[@data-posting-type] | //a[@href]"
+    " | //*[contains(@class, 'osting')] | //*[contains(@class, 'esult')]"
+    " | //*[contains(@class, 'pagination')] | //li[contains(@class, 'next')]"
+)
+_results_page_nodes = lxml_etree.XPath(_RESULTS_PAGE_XPATH) if HAS_LXML else None
+
+
+def _results_page_markup(html: str) -> Optional[str]:
+    """
+    Scan a results page with lxml and return only the subtrees the extractors
+    need, in document order; None when lxml is unavailable or fails.
+    """
+    if not HAS_LXML:
+        return None
+    try:
+        root = lxml_html.fromstring(html)
+    except (lxml_etree.ParserError, ValueError):
+        return None
+    parts = []
+    last = None
+    # XPath returns document order, so a node inside an already kept subtree
+    # is always a descendant of the previous kept node
+    for node in _results_page_nodes(root):
+        if last is not None and any(a is last for a in node.iterancestors()):
+            continue
+        last = node
+        parts.append(lxml_html.tostring(node, encoding='unicode', with_tail=False))
+    return ''.join(parts)
+
+
+def _node_text(node, limit: Optional[int] = None) -> str:
+    """
+    get_text(strip=True)[:limit] without the descendant walk when the element
+    wraps a single text node (the usual case for card titles and prices).
+    """
+    text = node.string
+    # .string may also be a comment/script node, which get_text() skips
+    text = text.strip() if type(text) is NavigableString else node.get_text(strip=True)
+    return text[:limit] if limit else text
+
+
+def _freeze_params(params: Dict[str, Any]) -> Optional[Tuple]:
+    """Hashable, order-independent view of search params (lists become tuples)."""
+    try:
+        key = tuple(sorted(
+            (k, tuple(v) if isinstance(v, list) else v) for k, v in params.items()
+        ))
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+# Image attributes checked (in order) for card thumbnails; lazy-loaded cards
+# carry the real URL in data-src while src holds a placeholder
+_IMG_ATTRS = ('data-src', 'data-lazy', 'data-original', 'src')
+
+
+@dataclass(slots=True)
+class ZonapropCard:
+    """Fields parsed from a single search-result card.
+
+    Kept as a slotted object while parsing; converted to the plain dict
+    returned by extract_property_cards via to_dict().
+    """
+    source: str = 'zonaprop'
+    source_url: Optional[str] = None
+    source_id: Optional[str] = None
+    title: Optional[str] = None
+    price: Optional[float] = None
+    currency: Optional[str] = None
+    thumbnail_url: Optional[str] = None
+    location_preview: Optional[str] = None
+    description: Optional[str] = None
+    total_area: Optional[float] = None
+    covered_area: Optional[float] = None
+    bedrooms: Optional[int] = None
+    bathrooms: Optional[int] = None
+    parking_spaces: Optional[int] = None
+    address: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the card as a plain dict (field order preserved)."""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+# Detail-page fields merged into search cards
+_DETAIL_KEYS = (
+    'total_area', 'covered_area', 'semi_covered_area',
+    'uncovered_area', 'bedrooms', 'bathrooms',
+    'parking_spaces', 'description', 'address', 'neighborhood',
+)
+
+# A search card that already has all of these gains nothing from its detail page
+# (only ZonapropCard fields: search cards never carry an images list)
+_COMPLETE_CARD_KEYS = (
+    'price', 'thumbnail_url', 'address', 'description',
+    'total_area', 'covered_area', 'bedrooms', 'bathrooms',
+)
+
+# Process-wide cache of detail-page data: source_url -> (stored_at, data).
+# Survives across scraper runs in the same worker, so scheduled re-scrapes
+# skip detail pages fetched within the TTL.
+DETAIL_CACHE_TTL = 6 * 3600
+DETAIL_CACHE_MAX_ENTRIES = 2000
+_detail_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+_detail_cache_lock = threading.Lock()
+
+
+def _get_cached_detail(url: str) -> Optional[Dict[str, Any]]:
+    """Return a copy of the cached detail data for url if still fresh."""
+    with _detail_cache_lock:
+        entry = _detail_cache.get(url)
+        if entry is None:
+            return None
+        stored_at, data = entry
+        if time.monotonic() - stored_at > DETAIL_CACHE_TTL:
+            del _detail_cache[url]
+            return None
+    # Cards get the detail lists (images, ...) merged in by reference
+    return copy.deepcopy(data)
+
+
+def _cache_detail(url: str, data: Dict[str, Any]) -> None:
+    """Store a copy of detail data for url, evicting the oldest entry when full."""
+    data = copy.deepcopy(data)
+    with _detail_cache_lock:
+        _detail_cache.pop(url, None)
+        if len(_detail_cache) >= DETAIL_CACHE_MAX_ENTRIES:
+            del _detail_cache[next(iter(_detail_cache))]
+        _detail_cache[url] = (time.monotonic(), data)
+
+
+# Cloudflare cookies from the last homepage warm-up, persisted so later runs
+# (and other workers) skip the warm-up while cf_clearance is still valid.
+# Anchored to the backend directory (not the CWD) so every entry point shares
+# it; ZONAPROP_CF_COOKIE_FILE overrides the location.
+CF_COOKIE_FILE = Path(
+    os.environ.get('ZONAPROP_CF_COOKIE_FILE')
+    or Path(__file__).resolve().parents[2] / '.cf_cookies.json'
+)
+CF_COOKIE_TTL = 25 * 60
+
+
+def _load_cf_cookies() -> Optional[Dict[str, Any]]:
+    """Return the saved {'user_agent', 'cookies'} if fresh and unexpired."""
+    try:
+        saved = json.loads(CF_COOKIE_FILE.read_text())
+    except (OSError, ValueError):
+        return None
+    now = time.time()
+    if now - saved.get('saved_at', 0) > CF_COOKIE_TTL:
+        return None
+    cookies = saved.get('cookies') or []
+    if any(c.get('expiry') is not None and c['expiry'] <= now for c in cookies):
+        return None
+    if not any(c.get('name') == 'cf_clearance' for c in cookies):
+        return None
+    return saved
+
+
+def _save_cf_cookies(cookies: List[Dict[str, Any]], user_agent: str) -> None:
+    """Persist warmed-driver cookies (atomically replaces the file)."""
+    payload = {'saved_at': time.time(), 'user_agent': user_agent, 'cookies': cookies}
+    tmp = CF_COOKIE_FILE.with_name(f"{CF_COOKIE_FILE.name}.{os.getpid()}.{threading.get_ident()}")
+    try:
+        # Live session cookies: owner-only, and os.replace keeps the mode
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, 'w') as fh:
+            fh.write(json.dumps(payload))
+        os.replace(tmp, CF_COOKIE_FILE)
+    except OSError as e:
+        logger.debug("[zonaprop] Could not save Cloudflare cookies: %s", e)
+
+
+# Persistent Chrome profiles (cookies incl. cf_clearance, cache) reused across
+# runs. A profile can only be open in one browser, so each concurrently
+# running driver claims its own slot directory.
+CHROME_PROFILE_ROOT = Path(tempfile.gettempdir()) / "zonaprop-chrome-profile"
+CHROME_PROFILE_SLOTS = 6
+_profiles_in_use: set = set()
+_profiles_lock = threading.Lock()
+
+
+def _claim_profile_dir() -> Optional[str]:
+    """Reserve a free profile directory, or None when every slot is busy."""
+    with _profiles_lock:
+        for slot in range(CHROME_PROFILE_SLOTS):
+            path = CHROME_PROFILE_ROOT / str(slot)
+            # SingletonLock: held by a Chrome of another process
+            if str(path) in _profiles_in_use or os.path.lexists(path / "SingletonLock"):
+                continue
+            _profiles_in_use.add(str(path))
+            return str(path)
+    return None
+
+
+def _release_profile_dir(path: str) -> None:
+    with _profiles_lock:
+        _profiles_in_use.discard(path)
+
+
+def _retry_after(response) -> Optional[float]:
+    """Seconds from a Retry-After header (delta-seconds form only), capped at 60."""
+    try:
+        return min(float(response.headers.get('Retry-After')), 60.0)
+    except (TypeError, ValueError):
+        return None
+
 
 class ZonapropListingScraper(BaseListingScraper):
     """
@@ -27,10 +479,26 @@ class ZonapropListingScraper(BaseListingScraper):
     - https://www.zonaprop.com.ar/departamentos-venta-capital-federal.html?pagina=2
     """
 
+    __slots__ = (
+        'driver', '_cf_warmed', '_driver_pool', '_pool_drivers', '_pool_launched',
+        '_detail_session', '_detail_limiter', '_selenium_lock',
+        '_selenium_delay', '_page_info', '_profile_dirs', '_search_key',
+    )
+
     PORTAL_NAME = "zonaprop"
     BASE_URL = "https://www.zonaprop.com.ar"
     MAX_PAGES = 10
-    DELAY_BETWEEN_PAGES = 3.0  # Longer delay for Selenium
+    DELAY_BETWEEN_PAGES = 1.0  # Min page interval; Selenium fallbacks pace themselves
+    SELENIUM_POOL_SIZE = 2  # Max Chrome instances fetching result pages at once
+    MAX_CONCURRENT_PAGES = 3  # Result pages 2..N fetched in parallel (Selenium bounded by the pool)
+    DETAIL_MIN_HTML_LENGTH = 20000  # Smaller detail responses are challenge/error pages
+    DETAIL_WORKERS = 4  # Concurrent detail-page fetches
+    DETAIL_RATE = 3.0  # Detail requests per second (token bucket refill)
+    DETAIL_BURST = 6  # Token bucket capacity
+    DETAIL_MAX_RETRIES = 3  # HTTP attempts per detail page on 429/503
+    SELENIUM_MIN_DELAY = 2.0  # Floor for the adaptive pause between Selenium detail pages
+    DETAIL_MAX_IMAGES = 20  # Gallery images kept per property
+    DETAIL_PAGE_TIMEOUT = 6  # Max seconds to wait for a Selenium detail page to render
 
     # Mapping for property types in URL
     PROPERTY_TYPE_MAP = {
@@ -121,16 +589,65 @@ class ZonapropListingScraper(BaseListingScraper):
     def __init__(self, search_params: Dict[str, Any], user_agent: Optional[str] = None):
         super().__init__(search_params, user_agent)
         self.driver = None
+        # Drivers that already hold Cloudflare cookies from a homepage visit
+        self._cf_warmed: set = set()
+        # Drivers available for Selenium page fetches (created lazily, see _acquire_driver)
+        self._driver_pool: Optional[asyncio.Queue] = None
+        self._pool_drivers: list = []
+        self._pool_launched = 0
+        # Keep-alive HTTP session for detail pages (open during enrichment only)
+        self._detail_session = None
+        self._detail_limiter: Optional[RateLimiter] = None
+        # The WebDriver is not thread-safe; detail workers take turns on it
+        self._selenium_lock = threading.Lock()
+        self._selenium_delay = 4.0
+        # Chrome profile directories claimed by this scraper's drivers
+        self._profile_dirs: List[str] = []
+        # (has next page, total results) of the parsed page, see _get_page_info
+        self._page_info: Optional[Tuple[bool, Optional[int]]] = None
+        # Hashable view of search_params for the search-path cache (None if unhashable)
+        self._search_key = _freeze_params(search_params)
 
     def _get_driver(self, headless: bool = False):
-        """Create and return a configured Chrome WebDriver.
+        """Return the primary WebDriver, used for detail-page enrichment.
 
-        Uses undetected-chromedriver if available to bypass Cloudflare.
-        Non-headless mode by default for better Cloudflare bypass.
+        Reuses a driver already launched for page fetches (keeping its
+        Cloudflare cookies) before starting a new one.
         """
         if self.driver:
             return self.driver
+        if self._pool_drivers:
+            self.driver = self._pool_drivers[0]
+            return self.driver
+
+        self.driver = self._new_driver(headless)
+        return self.driver
 
+    def _new_driver(self, headless: bool = False):
+        """Create and return a configured Chrome WebDriver.
+
+        Runs on a persistent profile when a slot is free, so Cloudflare
+        cookies survive between runs; falls back to a throwaway profile if
+        Chrome refuses the directory.
+        """
+        profile_dir = _claim_profile_dir()
+        if profile_dir is not None:
+            try:
+                driver = self._launch_chrome(headless, profile_dir)
+            except Exception as e:
+                _release_profile_dir(profile_dir)
+                logger.warning(f"[zonaprop] Chrome failed on profile {profile_dir}: {e}, using a fresh one")
+            else:
+                self._profile_dirs.append(profile_dir)
+                return driver
+        return self._launch_chrome(headless, None)
+
+    def _launch_chrome(self, headless: bool, profile_dir: Optional[str]):
+        """Start Chrome (optionally on profile_dir).
+
+        Uses undetected-chromedriver if available to bypass Cloudflare.
+        Non-headless mode by default for better Cloudflare bypass.
+        """
         # Try undetected-chromedriver first (better for Cloudflare)
         try:
             import undetected_chromedriver as uc
@@ -143,9 +660,9 @@ class ZonapropListingScraper(BaseListingScraper):
                 chrome_version, _ = winreg.QueryValueEx(key, "version")
                 winreg.CloseKey(key)
                 version_main = int(chrome_version.split('.')[0])
-                print(f"[DEBUG] [zonaprop] Detected Chrome v{version_main}")
+                logger.debug("[zonaprop] Detected Chrome v%d", version_main)
             except Exception as e:
-                print(f"[DEBUG] [zonaprop] Could not detect Chrome version: {e}")
+                logger.debug("[zonaprop] Could not detect Chrome version: %s", e)
 
             options = uc.ChromeOptions()
             if headless:
@@ -153,15 +670,20 @@ class ZonapropListingScraper(BaseListingScraper):
             options.add_argument('--no-sandbox')
             options.add_argument('--disable-dev-shm-usage')
             options.add_argument('--window-size=1920,1080')
+            options.add_argument('--disable-features=IsolateOrigins,site-per-process')
+            if profile_dir:
+                options.add_argument(f'--user-data-dir={profile_dir}')
+            options.page_load_strategy = 'eager'
 
-            self.driver = uc.Chrome(options=options, version_main=version_main)
-            print("[DEBUG] [zonaprop] Using undetected-chromedriver")
-            return self.driver
+            driver = uc.Chrome(options=options, version_main=version_main)
+            self._block_heavy_resources(driver)
+            logger.debug("[zonaprop] Using undetected-chromedriver")
+            return driver
 
         except ImportError:
             pass
         except Exception as e:
-            print(f"[DEBUG] [zonaprop] undetected-chromedriver failed: {e}, falling back to selenium")
+            logger.debug("[zonaprop] undetected-chromedriver failed: %s, falling back to selenium", e)
 
         # Fallback to regular selenium
         from selenium import webdriver
@@ -179,11 +701,16 @@ class ZonapropListingScraper(BaseListingScraper):
         chrome_options.add_argument('--window-size=1920,1080')
         chrome_options.add_argument('--disable-gpu')
         chrome_options.add_argument('--lang=es-AR')
+        chrome_options.add_argument('--disable-features=IsolateOrigins,site-per-process')
+        if profile_dir:
+            chrome_options.add_argument(f'--user-data-dir={profile_dir}')
+        chrome_options.page_load_strategy = 'eager'
 
-        self.driver = webdriver.Chrome(options=chrome_options)
+        driver = webdriver.Chrome(options=chrome_options)
+        self._block_heavy_resources(driver)
 
         # Override navigator.webdriver flag (CF detection vector)
-        self.driver.execute_cdp_cmd(
+        driver.execute_cdp_cmd(
             "Page.addScriptToEvaluateOnNewDocument",
             {"source": """
                 Object.defineProperty(navigator, 'webdriver', {get: () => undefined});
@@ -193,33 +720,88 @@ class ZonapropListingScraper(BaseListingScraper):
             """},
         )
 
-        print("[DEBUG] [zonaprop] Using regular selenium (headless)" if headless else "[DEBUG] [zonaprop] Using regular selenium")
-        return self.driver
+        logger.debug("[zonaprop] Using regular selenium%s", " (headless)" if headless else "")
+        return driver
+
+    @staticmethod
+    def _block_heavy_resources(driver) -> None:
+        """Stop the browser from downloading images, fonts and trackers."""
+        # Gallery URLs come from inline JSON, so no image bytes are needed
+        try:
+            driver.execute_cdp_cmd('Network.enable', {})
+            driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': BLOCKED_RESOURCE_URLS})
+        except Exception as e:
+            logger.debug("[zonaprop] Could not block resources: %s", e)
+
+    @staticmethod
+    def _page_source(driver) -> str:
+        """Read the rendered document HTML through CDP.
+
+        DOM.getOuterHTML skips the JS round-trip behind driver.page_source;
+        falls back to page_source on drivers without CDP support.
+        """
+        try:
+            doc = driver.execute_cdp_cmd('DOM.getDocument', {'depth': 0})
+            return driver.execute_cdp_cmd(
+                'DOM.getOuterHTML', {'nodeId': doc['root']['nodeId']}
+            )['outerHTML']
+        except Exception:
+            return driver.page_source
+
+    async def _acquire_driver(self):
+        """Borrow a driver for a page fetch, launching one while below SELENIUM_POOL_SIZE."""
+        if self._driver_pool is None:
+            self._driver_pool = asyncio.Queue()
+        if self._driver_pool.empty() and self._pool_launched < self.SELENIUM_POOL_SIZE:
+            self._pool_launched += 1
+            try:
+                driver = await asyncio.to_thread(self._new_driver)
+            except Exception:
+                self._pool_launched -= 1
+                raise
+            self._pool_drivers.append(driver)
+            return driver
+        return await self._driver_pool.get()
+
+    def _release_driver(self, driver) -> None:
+        """Return a borrowed driver to the pool."""
+        self._driver_pool.put_nowait(driver)
 
     def _close_driver(self):
-        """Close the WebDriver"""
-        if self.driver:
+        """Close the primary WebDriver, every pooled driver and the detail session"""
+        if self._detail_session is not None:
+            try:
+                self._detail_session.close()
+            except Exception:
+                pass
+            self._detail_session = None
+
+        drivers = list(self._pool_drivers)
+        if self.driver and self.driver not in drivers:
+            drivers.append(self.driver)
+        for driver in drivers:
             try:
-                self.driver.quit()
+                driver.quit()
             except Exception:
                 pass
-            self.driver = None
+        self.driver = None
+        for profile_dir in self._profile_dirs:
+            _release_profile_dir(profile_dir)
+        self._profile_dirs = []
+        self._cf_warmed.clear()
+        self._driver_pool = None
+        self._pool_drivers = []
+        self._pool_launched = 0
 
-    def _slugify(self, text: str) -> str:
+    @staticmethod
+    def _slugify(text: str) -> str:
         """Convert text to URL-friendly slug"""
         if not text:
             return ""
-        # Lowercase and replace spaces
-        slug = text.lower().strip()
-        # Replace accented characters
-        replacements = {
-            'á': 'a', 'é': 'e', 'í': 'i', 'ó': 'o', 'ú': 'u',
-            'ñ': 'n', 'ü': 'u',
-        }
-        for old, new in replacements.items():
-            slug = slug.replace(old, new)
+        # Lowercase and replace accented characters (one translate pass)
+        slug = text.lower().strip().translate(_ACCENT_TABLE)
         # Replace spaces and special chars with hyphens
-        slug = re.sub(r'[^a-z0-9]+', '-', slug)
+        slug = _RE_SLUG_NONALNUM.sub('-', slug)
         slug = slug.strip('-')
         return slug
 
@@ -235,28 +817,45 @@ class ZonapropListingScraper(BaseListingScraper):
         - /departamentos-venta-palermo-capital-federal.html
         - /casas-alquiler-zona-norte-buenos-aires-100000-200000-dolar.html
         """
-        params = self.search_params
+        if self._search_key is None:
+            url = self._build_search_path(self.search_params)
+        else:
+            url = self._cached_search_path(self._search_key)
+
+        # Add pagination
+        if page > 1:
+            url += f"?pagina={page}"
 
+        return url
+
+    @classmethod
+    @lru_cache(maxsize=128)
+    def _cached_search_path(cls, search_key: Tuple) -> str:
+        """Memoized _build_search_path; the path only depends on the params."""
+        return cls._build_search_path(dict(search_key))
+
+    @classmethod
+    def _build_search_path(cls, params: Dict[str, Any]) -> str:
+        """Build the page-independent search URL (no ?pagina=) from params."""
         # Build path segments (joined by hyphens in Zonaprop)
         segments = []
 
         # Property type (required, defaults to departamentos)
+        # Map keys are already lowercase, so one lowered lookup suffices
         property_type = params.get("property_type", "departamento").lower()
-        if property_type in self.PROPERTY_TYPE_MAP:
-            segments.append(self.PROPERTY_TYPE_MAP[property_type])
-        else:
-            segments.append("departamentos")  # Default
+        segments.append(cls.PROPERTY_TYPE_MAP.get(property_type, "departamentos"))
 
         # Operation type (required)
         operation = params.get("operation_type", "venta").lower()
-        segments.append(self.OPERATION_TYPE_MAP.get(operation, "venta"))
+        segments.append(cls.OPERATION_TYPE_MAP.get(operation, "venta"))
 
         # Neighborhoods OR Location (not both - neighborhood implies location)
         neighborhoods = params.get("neighborhoods", [])
         if neighborhoods and len(neighborhoods) == 1:
             # If neighborhood is specified, use it (implies the city)
             neighborhood = neighborhoods[0].lower()
-            neighborhood_slug = self.NEIGHBORHOOD_MAP.get(neighborhood, self._slugify(neighborhood))
+            # Only slugify unmapped names (a .get() default would be built on every call)
+            neighborhood_slug = cls.NEIGHBORHOOD_MAP.get(neighborhood) or cls._slugify(neighborhood)
             segments.append(neighborhood_slug)
         else:
             # No neighborhood, use city/province
@@ -265,7 +864,7 @@ class ZonapropListingScraper(BaseListingScraper):
 
             location = city or province
             if location:
-                location_slug = self.LOCATION_MAP.get(location, self._slugify(location))
+                location_slug = cls.LOCATION_MAP.get(location) or cls._slugify(location)
                 segments.append(location_slug)
 
         # Build filter segments
@@ -306,13 +905,17 @@ class ZonapropListingScraper(BaseListingScraper):
 
         # Build URL
         all_segments = segments + filter_segments
-        url = f"{self.BASE_URL}/{'-'.join(all_segments)}.html"
+        return f"{cls.BASE_URL}/{'-'.join(all_segments)}.html"
 
-        # Add pagination
-        if page > 1:
-            url += f"?pagina={page}"
-
-        return url
+    def parse_html(self, html: str) -> None:
+        """
+        Parse a results page. lxml pre-selects the card, pagination and link
+        subtrees so BeautifulSoup only builds those; the whole page is parsed
+        when that scan is unavailable.
+        """
+        markup = _results_page_markup(html)
+        self.soup = BeautifulSoup(html if markup is None else markup, HTML_PARSER)
+        self._page_info = None
 
     async def fetch_page(self, url: str) -> str:
         """
@@ -322,24 +925,49 @@ class ZonapropListingScraper(BaseListingScraper):
         3. httpx (plain fallback)
         4. Selenium (absolute last resort)
         """
-        from .http_client import _is_cf_blocked
-        # Levels 1-3: curl_cffi / FlareSolverr / httpx via base class
+        # Levels 1-3: curl_cffi / FlareSolverr / httpx. The posting-card check
+        # runs inside the fetch, ahead of the shared challenge markers
         try:
-            html = await super().fetch_page(url)
-            if len(html) > 5000 and not _is_cf_blocked(html):
+            html = await fetch_with_browser_fingerprint(
+                url, user_agent=self.user_agent, session=self._http_session,
+                is_usable=self._is_usable_page,
+            )
+            if self._is_usable_page(html):
                 logger.info(f"[zonaprop] fetch_with_browser_fingerprint OK, length: {len(html)}")
                 return html
             logger.warning("[zonaprop] Got Cloudflare challenge, trying Selenium...")
+            page_rate_limiter.back_off(urlparse(url).netloc)
         except Exception as e:
             logger.warning(f"[zonaprop] HTTP fetch failed: {e}, trying Selenium...")
 
-        # Level 3: Selenium fallback
-        return await asyncio.to_thread(self._fetch_with_selenium, url)
+        # Level 3: Selenium fallback, on a driver borrowed from the pool
+        driver = await self._acquire_driver()
+        try:
+            return await asyncio.to_thread(self._fetch_with_selenium, url, driver)
+        finally:
+            self._release_driver(driver)
+
+    @staticmethod
+    def _is_usable_page(html: str) -> bool:
+        """True for a real results page, False for a Cloudflare challenge/block.
 
-    def _fetch_with_selenium(self, url: str) -> str:
+        A posting-card marker settles it with one substring search (challenge
+        pages never render cards, while real pages may quote e.g. "Access
+        denied" somewhere). Card-less pages, such as a genuinely empty search,
+        fall back to the size + challenge-marker check.
+        """
+        if _RESULTS_PAGE_MARKER in html:
+            return True
+        return (
+            len(html) > 5000
+            and not _is_cf_blocked(html)
+            and not any(marker in html for marker in _ZONAPROP_CF_MARKERS)
+        )
+
+    def _fetch_with_selenium(self, url: str, driver) -> str:
         """Fetch page using Selenium, handling Cloudflare JS challenges."""
-        import time
         try:
+            from selenium.common.exceptions import TimeoutException
             from selenium.webdriver.common.by import By
             from selenium.webdriver.support.ui import WebDriverWait
             from selenium.webdriver.support import expected_conditions as EC
@@ -349,22 +977,14 @@ class ZonapropListingScraper(BaseListingScraper):
                 "Install curl_cffi for production: pip install curl_cffi"
             )
 
-        driver = self._get_driver()
-
         try:
-            # Warm up: visit homepage first to get CF cookies
-            logger.info("[zonaprop] Selenium: warming up with homepage visit")
-            driver.get(self.BASE_URL)
-            time.sleep(4)
+            # Warm up: visit homepage first to get CF cookies (once per driver)
+            self._warm_up_driver(driver, delay=4)
 
             # Now navigate to the search URL (with cookies set)
             logger.info(f"[zonaprop] Selenium loading: {url}")
             driver.get(url)
 
-            WebDriverWait(driver, 15).until(
-                EC.presence_of_element_located((By.TAG_NAME, "body"))
-            )
-
             # Wait for Cloudflare JS challenge to resolve (datacenter IPs trigger this)
             cf_markers = [
                 'Just a moment', 'Checking your browser',
@@ -374,7 +994,7 @@ class ZonapropListingScraper(BaseListingScraper):
                 'Enable JavaScript and cookies',
             ]
             for i in range(25):  # up to 25 seconds for CF challenge
-                page_src = driver.page_source
+                page_src = self._page_source(driver)
                 if any(marker in page_src for marker in cf_markers):
                     logger.debug(f"[zonaprop] Cloudflare challenge active, waiting... ({i+1}s)")
                     time.sleep(1)
@@ -382,18 +1002,15 @@ class ZonapropListingScraper(BaseListingScraper):
                     logger.info(f"[zonaprop] Cloudflare challenge resolved after {i}s")
                     break
 
-            # Extra wait for page content to render after CF resolves
-            time.sleep(3)
-
-            # Try to wait for property cards
+            # Wait (polling fast) until the result cards have rendered
             try:
-                WebDriverWait(driver, 10).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, '[data-qa="posting PROPERTY"], .postingCard, [class*="PostingCard"], a[href*=".html"]'))
+                WebDriverWait(driver, 15, poll_frequency=0.2).until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, _RESULT_CARD_READY_SELECTOR))
                 )
-            except Exception:
+            except TimeoutException:
                 logger.debug("[zonaprop] No property cards found with expected selectors, continuing anyway")
 
-            html = driver.page_source
+            html = self._page_source(driver)
             page_title = driver.title or "(sin título)"
             logger.info(f"[zonaprop] Got HTML via Selenium, length: {len(html)}, title: {page_title}")
 
@@ -412,21 +1029,51 @@ class ZonapropListingScraper(BaseListingScraper):
             logger.error(f"[zonaprop] Selenium error: {e}")
             raise
 
+    def _warm_up_driver(self, driver, delay: float) -> None:
+        """Visit the homepage once per driver so it picks up Cloudflare cookies.
+
+        Reuses persisted cookies (no wait) when they are still valid for this
+        driver's User-Agent; otherwise waits out the challenge and saves them.
+        """
+        if driver in self._cf_warmed:
+            return
+        driver.get(self.BASE_URL)
+        user_agent = driver.execute_script("return navigator.userAgent")
+
+        saved = _load_cf_cookies()
+        if saved and saved.get('user_agent') == user_agent:
+            logger.info("[zonaprop] Selenium: reusing saved Cloudflare cookies")
+            for cookie in saved['cookies']:
+                try:
+                    driver.add_cookie(cookie)
+                except Exception as e:
+                    logger.debug("[zonaprop] Could not restore cookie %s: %s", cookie.get('name'), e)
+        else:
+            logger.info("[zonaprop] Selenium: warming up with homepage visit")
+            time.sleep(delay)
+            _save_cf_cookies(driver.get_cookies(), user_agent)
+        self._cf_warmed.add(driver)
+
     async def scrape_all_pages(self, max_properties: int = 100) -> List[Dict[str, Any]]:
         """
         Scrape all pages using Selenium, then enrich with detail page data.
         Override to ensure driver is closed after scraping.
         """
+        # One keep-alive session for every result page of this run
+        self._http_session = open_async_session()
         try:
             cards = await super().scrape_all_pages(max_properties)
             # Enrich cards with images and features from detail pages
-            # Run in thread to avoid blocking the event loop with Selenium
+            # Run in thread to avoid blocking the event loop (HTTP/Selenium are sync)
             if cards:
-                self._get_driver()
                 cards = await asyncio.to_thread(self._enrich_cards_from_detail, cards)
             return cards
         finally:
-            self._close_driver()
+            if self._http_session is not None:
+                await self._http_session.close()
+                self._http_session = None
+            # driver.quit() blocks for a while per Chrome instance
+            await asyncio.to_thread(self._close_driver)
 
     def extract_property_cards(self) -> List[Dict[str, Any]]:
         """
@@ -445,49 +1092,39 @@ class ZonapropListingScraper(BaseListingScraper):
             return []
 
         cards = []
+        # Same listing can appear under several URL forms / nested wrappers;
+        # dedup on the numeric id (URL when there is none)
+        seen_ids = set()
 
-        # Zonaprop listing card selectors
-        card_selectors = [
-            'div[data-qa="posting PROPERTY"]',
-            'div.postingCard',
-            'div[class*="PostingCard"]',
-            'article[data-posting-type]',
-            'div[class*="posting-card"]',
-            '[data-qa="posting"]',
-        ]
-
-        card_elements = []
-        for selector in card_selectors:
-            card_elements = self.soup.select(selector)
-            if card_elements:
-                logger.debug(f"Found {len(card_elements)} cards with selector: {selector}")
-                logger.debug(f"[zonaprop] Found {len(card_elements)} cards with selector: {selector}")
-                break
+        # Zonaprop listing card selectors (one tree walk for all fallbacks)
+        card_elements = _CARD_SELECTOR.select(self.soup)
+        if card_elements:
+            logger.debug("[zonaprop] Found %d cards", len(card_elements))
 
         if not card_elements:
             # Fallback: look for any links to property pages
             logger.debug("[zonaprop] No cards found with standard selectors, trying fallback...")
 
-            # Zonaprop property URLs contain long numeric IDs
-            property_links = self.soup.select('a[href*=".html"]')
-            logger.debug(f"[zonaprop] Found {len(property_links)} .html links")
-
-            seen_urls = set()
-            for link in property_links:
-                href = link.get('href', '')
-                if href and href not in seen_urls and self._is_property_url(href):
-                    seen_urls.add(href)
-                    full_url = self._clean_url(urljoin(self.BASE_URL, href))
-                    cards.append({
-                        'source_url': full_url,
-                        'source_id': self._extract_id_from_url(full_url),
-                        'source': 'zonaprop',
-                        'title': link.get_text(strip=True)[:200] or None,
-                        'price': None,
-                        'currency': None,
-                        'thumbnail_url': None,
-                        'location_preview': None,
-                    })
+            # Zonaprop property URLs contain long numeric IDs: one walk over
+            # the anchors and one regex per .html href, whose match also
+            # yields the id (no separate _is_property_url/_extract_id pass)
+            for link in self.soup.find_all('a', href=True):
+                href = link['href']
+                if '.html' not in href:
+                    continue
+                match = _RE_PROPERTY_ID.search(href)
+                if match is None or _is_listing_path(href):
+                    continue
+                source_id = match.group(1)
+                if source_id in seen_ids:
+                    continue
+                seen_ids.add(source_id)
+                full_url = self._clean_url(self._absolute_url(href))
+                cards.append(ZonapropCard(
+                    source_url=full_url,
+                    source_id=source_id,
+                    title=link.get_text(strip=True)[:200] or None,
+                ).to_dict())
 
             logger.debug(f"[zonaprop] Fallback found {len(cards)} property URLs")
             return cards
@@ -495,9 +1132,9 @@ class ZonapropListingScraper(BaseListingScraper):
         # Process each card
         for card in card_elements:
             try:
-                card_data = self._parse_card(card)
-                if card_data and card_data.get('source_url'):
-                    cards.append(card_data)
+                card_data = self._parse_card(card, seen_ids)
+                if card_data and card_data.source_url:
+                    cards.append(card_data.to_dict())
             except Exception as e:
                 logger.warning(f"Error parsing card: {e}")
                 continue
@@ -509,31 +1146,43 @@ class ZonapropListingScraper(BaseListingScraper):
         if not url:
             return False
 
-        # Zonaprop property URLs end with .html and contain numeric ID (8+ digits)
+        # Zonaprop property URLs end with "-<numeric ID>.html" (7+ digits)
         # Example: /propiedades/departamento-en-venta-en-palermo-50123456.html
-        has_html = '.html' in url
-        has_long_id = bool(re.search(r'-(\d{7,})\.html', url))
+        if not _RE_PROPERTY_ID.search(url):
+            return False
 
         # Exclude search/listing pages (they have format like departamentos-venta-capital-federal.html)
-        is_listing = bool(re.match(r'^/?(departamentos|casas|ph|terrenos|oficinas|locales|cocheras)-', url))
-
-        return has_html and has_long_id and not is_listing
+        return not _is_listing_path(url)
 
     def _extract_id_from_url(self, url: str) -> Optional[str]:
         """Extract property ID from URL"""
         # Zonaprop IDs are typically 8+ digit numbers at end of URL
         # Example: departamento-en-venta-en-palermo-50123456.html
-        match = re.search(r'-(\d{7,})\.html', url)
+        match = _RE_PROPERTY_ID.search(url)
         if match:
             return match.group(1)
 
         # Alternative: any long numeric segment
-        match = re.search(r'(\d{7,})', url)
+        match = _RE_LONG_NUM.search(url)
         if match:
             return match.group(1)
 
         return None
 
+    def _absolute_url(self, url: str) -> str:
+        """Resolve a scheme-relative, root-relative or relative href against BASE_URL.
+
+        Cheaper than urljoin (no full urlparse) for the handful of shapes
+        Zonaprop actually emits.
+        """
+        if url.startswith('//'):
+            return 'https:' + url
+        if url[:1] == '/':
+            return self.BASE_URL + url
+        if url.startswith('http'):
+            return url
+        return f"{self.BASE_URL}/{url}"
+
     @staticmethod
     def _clean_url(url: str) -> str:
         """Strip tracking query params and fragment from property URL.
@@ -544,196 +1193,95 @@ class ZonapropListingScraper(BaseListingScraper):
         parsed = urlparse(url)
         return urlunparse(parsed._replace(query="", fragment=""))
 
-    def _parse_card(self, card) -> Optional[Dict[str, Any]]:
-        """Parse a single property card element"""
-        data = {
-            'source': 'zonaprop',
-            'source_url': None,
-            'source_id': None,
-            'title': None,
-            'price': None,
-            'currency': None,
-            'thumbnail_url': None,
-            'location_preview': None,
-            'description': None,
-            'total_area': None,
-            'covered_area': None,
-            'bedrooms': None,
-            'bathrooms': None,
-            'parking_spaces': None,
-            'address': None,
-        }
-
-        # Extract URL - look for main link
-        link_selectors = [
-            'a[data-qa="posting PROPERTY"]',
-            'a[href*=".html"]',
-            'a[class*="link"]',
-            'a',
-        ]
+    def _parse_card(self, card, seen_ids: Optional[set] = None) -> Optional[ZonapropCard]:
+        """Parse a single property card element.
 
-        link = None
-        for selector in link_selectors:
-            link = card.select_one(selector)
-            if link and link.get('href'):
-                href = link.get('href', '')
-                # Verify it's a property URL (has long ID)
-                if re.search(r'-\d{7,}\.html', href):
-                    break
-                link = None
+        With seen_ids, returns None for an already-seen listing before parsing
+        any field (and records new ones).
+        """
+        data = ZonapropCard()
+
+        # Extract URL - main link is the first <a> whose href carries a property ID
+        # (find() stops at the first match)
+        link = card.find('a', href=_RE_PROPERTY_ID)
 
         # If card itself is a link
         if not link and card.name == 'a' and card.get('href'):
             link = card
 
         if link:
-            href = link.get('href', '')
-            if href.startswith('/'):
-                data['source_url'] = urljoin(self.BASE_URL, href)
-            elif href.startswith('http'):
-                data['source_url'] = href
-            else:
-                data['source_url'] = f"{self.BASE_URL}/{href}"
+            data.source_url = self._clean_url(self._absolute_url(link.get('href', '')))
+            data.source_id = self._extract_id_from_url(data.source_url)
 
-            data['source_url'] = self._clean_url(data['source_url'])
-            data['source_id'] = self._extract_id_from_url(data['source_url'])
-
-        if not data['source_url']:
+        if not data.source_url:
             return None
 
-        # Extract title
-        title_selectors = [
-            '[data-qa="POSTING_CARD_TITLE"]',
-            '[data-qa="POSTING_CARD_LOCATION"]',
-            'h2',
-            'h3',
-            '[class*="title"]',
-            '[class*="Title"]',
-        ]
+        if seen_ids is not None:
+            key = data.source_id or data.source_url
+            if key in seen_ids:
+                return None
+            seen_ids.add(key)
 
-        for selector in title_selectors:
-            title_elem = card.select_one(selector)
-            if title_elem:
-                data['title'] = title_elem.get_text(strip=True)[:500]
-                break
+        # Extract title
+        title_elem = _CARD_TITLE_SELECTOR.select_one(card)
+        if title_elem:
+            data.title = _node_text(title_elem, 500)
 
         # Extract price
-        price_selectors = [
-            '[data-qa="POSTING_CARD_PRICE"]',
-            '[class*="Price"]',
-            '[class*="price"]',
-        ]
-
-        for selector in price_selectors:
-            price_elem = card.select_one(selector)
-            if price_elem:
-                price_text = price_elem.get_text(strip=True)
-                price_amount, currency = self.clean_price(price_text)
-                data['price'] = price_amount
-                data['currency'] = currency
+        price_elem = _CARD_PRICE_SELECTOR.select_one(card)
+        if price_elem:
+            price_text = _node_text(price_elem)
+            data.price, data.currency = self.clean_price(price_text)
+
+        # Extract thumbnail (first selector whose <img> has a usable URL)
+        for img_elem in _CARD_IMG_SELECTOR.firsts(card):
+            attrs = img_elem.attrs
+            img_url = next(
+                (url for url in map(attrs.get, _IMG_ATTRS) if url and not url.startswith('data:')),
+                None,
+            )
+            if img_url:
+                data.thumbnail_url = self._absolute_url(img_url)
                 break
 
-        # Extract thumbnail
-        img_selectors = [
-            'img[data-qa]',
-            'img[class*="image"]',
-            'img[class*="Image"]',
-            'img',
-        ]
-
-        img_attrs = ['src', 'data-src', 'data-lazy', 'data-original']
-
-        for selector in img_selectors:
-            img_elem = card.select_one(selector)
-            if img_elem:
-                for attr in img_attrs:
-                    img_url = img_elem.get(attr)
-                    if img_url and not img_url.startswith('data:'):
-                        if img_url.startswith('//'):
-                            data['thumbnail_url'] = f"https:{img_url}"
-                        elif img_url.startswith('/'):
-                            data['thumbnail_url'] = urljoin(self.BASE_URL, img_url)
-                        else:
-                            data['thumbnail_url'] = img_url
-                        break
-                if data['thumbnail_url']:
-                    break
-
         # Extract location preview
-        location_selectors = [
-            '[data-qa="POSTING_CARD_LOCATION"]',
-            '[class*="Location"]',
-            '[class*="location"]',
-            '[class*="address"]',
-        ]
-
-        for selector in location_selectors:
-            loc_elem = card.select_one(selector)
-            if loc_elem:
-                data['location_preview'] = loc_elem.get_text(strip=True)[:200]
-                break
+        loc_elem = _CARD_LOCATION_SELECTOR.select_one(card)
+        if loc_elem:
+            data.location_preview = _node_text(loc_elem, 200)
 
         # Extract description / subtitle
-        desc_selectors = [
-            '[data-qa="POSTING_CARD_DESCRIPTION"]',
-            '[class*="Description"]',
-            '[class*="description"]',
-            '[class*="subtitle"]',
-        ]
-        for selector in desc_selectors:
-            desc_elem = card.select_one(selector)
-            if desc_elem:
-                data['description'] = desc_elem.get_text(strip=True)[:1000]
-                break
+        desc_elem = _CARD_DESCRIPTION_SELECTOR.select_one(card)
+        if desc_elem:
+            data.description = _node_text(desc_elem, 1000)
 
         # Extract address (separate from location/neighborhood)
-        address_selectors = [
-            '[data-qa="POSTING_CARD_ADDRESS"]',
-            '[class*="Address"]',
-            '[class*="address"]',
-        ]
-        for selector in address_selectors:
-            addr_elem = card.select_one(selector)
-            if addr_elem:
-                data['address'] = addr_elem.get_text(strip=True)[:300]
-                break
+        addr_elem = _CARD_ADDRESS_SELECTOR.select_one(card)
+        if addr_elem:
+            data.address = _node_text(addr_elem, 300)
 
         # Extract features (area, rooms, bathrooms, parking)
-        features_selectors = [
-            '[data-qa="POSTING_CARD_FEATURES"]',
-            '[class*="PostingMainFeatures"]',
-            '[class*="postingMainFeatures"]',
-            '[class*="main-features"]',
-            '[class*="CardFeatures"]',
-            '[class*="posting-features"]',
-        ]
-
-        features_text = ""
-        for selector in features_selectors:
-            feat_elem = card.select_one(selector)
-            if feat_elem:
-                features_text = feat_elem.get_text(" ", strip=True)
-                break
+        feat_elem = _CARD_FEATURES_SELECTOR.select_one(card)
+        features_text = feat_elem.get_text(" ", strip=True) if feat_elem else ""
 
         # Fallback: collect text from all small feature spans inside the card
         if not features_text:
             feat_spans = card.select('span')
             snippets = []
             for span in feat_spans:
-                txt = span.get_text(strip=True)
+                txt = _node_text(span)
                 # Feature-like snippets: contain m², amb, baño, dorm, coch
-                if re.search(r'm[²2]|amb|bañ|dorm|coch', txt, re.IGNORECASE):
+                if _RE_FEATURE_SNIPPET.search(txt):
                     snippets.append(txt)
             if snippets:
                 features_text = " ".join(snippets)
 
         if features_text:
             parsed = self.parse_features_text(features_text)
-            data['total_area'] = parsed.get('total_area')
-            data['covered_area'] = parsed.get('covered_area')
-            data['bedrooms'] = parsed.get('bedrooms')
-            data['bathrooms'] = parsed.get('bathrooms')
-            data['parking_spaces'] = parsed.get('parking_spaces')
+            data.total_area = parsed.get('total_area')
+            data.covered_area = parsed.get('covered_area')
+            data.bedrooms = parsed.get('bedrooms')
+            data.bathrooms = parsed.get('bathrooms')
+            data.parking_spaces = parsed.get('parking_spaces')
 
         return data
 
@@ -743,64 +1291,46 @@ class ZonapropListingScraper(BaseListingScraper):
 
         Looks for pagination elements.
         """
-        if not self.soup:
-            return False
-
-        # Look for pagination
-        pagination_selectors = [
-            'a[data-qa="PAGING_NEXT"]',
-            'a[href*="pagina="]',
-            '.pagination a.next',
-            '.pagination__next',
-            'a[rel="next"]',
-            'li.next a',
-        ]
-
-        for selector in pagination_selectors:
-            try:
-                next_link = self.soup.select_one(selector)
-                if next_link:
-                    return True
-            except Exception:
-                continue
-
-        # Check results count
-        result_count_elem = self.soup.select_one('[data-qa="SEARCH_RESULTS_COUNT"], .results-count')
-        if result_count_elem:
-            text = result_count_elem.get_text()
-            match = re.search(r'(\d+)\s*-\s*(\d+)\s*de\s*(\d+)', text.replace('.', ''))
-            if match:
-                current_end = int(match.group(2))
-                total = int(match.group(3))
-                return current_end < total
-
-        return False
+        return self._get_page_info()[0]
 
     def get_total_results(self) -> Optional[int]:
         """
         Try to extract total number of results from page.
         """
-        if not self.soup:
-            return None
+        return self._get_page_info()[1]
 
-        selectors = [
-            '[data-qa="SEARCH_RESULTS_COUNT"]',
-            '.results-count',
-            '[class*="ResultCount"]',
-            '[class*="result-count"]',
-        ]
+    def _get_page_info(self) -> Tuple[bool, Optional[int]]:
+        """(has next page, total results) for the parsed page.
+
+        Both come from one tree walk, memoized until the next parse_html.
+        """
+        if not self.soup:
+            return False, None
+        if self._page_info is not None:
+            return self._page_info
+
+        next_link, *count_elems = _PAGE_INFO_SELECTOR.first_of_each(self.soup)
+
+        # Pagination link, else the "1 - 20 de 1234" counter
+        has_next = next_link is not None
+        if not has_next:
+            paging_elem = count_elems[0] or count_elems[1]
+            if paging_elem is not None:
+                match = _RE_PAGING.search(paging_elem.get_text().replace('.', ''))
+                if match:
+                    has_next = int(match.group(2)) < int(match.group(3))
 
-        for selector in selectors:
-            elem = self.soup.select_one(selector)
-            if elem:
-                text = elem.get_text()
-                # Look for numbers
-                numbers = re.findall(r'(\d+)', text.replace('.', '').replace(',', ''))
+        # Total: largest number in the first counter that has any
+        total = None
+        for elem in count_elems:
+            if elem is not None:
+                numbers = _RE_DIGITS.findall(elem.get_text().replace('.', '').replace(',', ''))
                 if numbers:
-                    # Take the largest number (usually the total)
-                    return max(int(n) for n in numbers)
+                    total = max(int(n) for n in numbers)
+                    break
 
-        return None
+        self._page_info = (has_next, total)
+        return self._page_info
 
     # ── Detail page enrichment ─────────────────────────────────────
 
@@ -811,79 +1341,213 @@ class ZonapropListingScraper(BaseListingScraper):
         Visit each property's detail page to extract all images and features.
 
         The search page only provides 1 thumbnail per listing. Detail pages
-        have the full image gallery and additional property data.
+        have the full image gallery and additional property data. Pages are
+        fetched by DETAIL_WORKERS threads sharing a DETAIL_RATE token bucket;
+        results are merged back on this thread.
         """
-        import time
-
         enriched = 0
         to_enrich = cards
-        print(f"[DEBUG] [zonaprop] Enriching {len(to_enrich)} cards from detail pages...")
+        logger.debug("[zonaprop] Enriching %d cards from detail pages...", len(to_enrich))
 
-        # Warm up: visit homepage first to get Cloudflare cookies
-        try:
-            print("[DEBUG] [zonaprop] Warming up driver with homepage visit...")
-            self.driver.get(self.BASE_URL)
-            time.sleep(3)
-        except Exception as e:
-            logger.debug(f"[zonaprop] Warmup failed: {e}")
+        # Cards already carrying everything the detail page offers are skipped
+        pending = [
+            i for i, card in enumerate(to_enrich)
+            if card.get('source_url') and not self._is_card_complete(card)
+        ]
 
-        for i, card in enumerate(to_enrich):
-            url = card.get('source_url')
-            if not url:
-                continue
-            try:
-                detail_data = self._extract_detail_data(url)
+        # Detail pages go over HTTP first (closed in _close_driver)
+        self._detail_session = self._open_detail_session()
+        self._detail_limiter = RateLimiter(rate=self.DETAIL_RATE, capacity=self.DETAIL_BURST)
+
+        with ThreadPoolExecutor(max_workers=self.DETAIL_WORKERS) as pool:
+            futures = {
+                pool.submit(self._get_detail_data, to_enrich[i]['source_url']): i
+                for i in pending
+            }
+            for future in as_completed(futures):
+                i = futures[future]
+                try:
+                    detail_data = future.result()
+                except Exception as e:
+                    logger.debug("[zonaprop]   Card %d/%d: ERROR - %s", i + 1, len(to_enrich), e)
+                    continue
+
+                card = to_enrich[i]
 
                 # Merge images (detail page has the full gallery)
                 if detail_data.get('images'):
                     card['images'] = detail_data['images']
 
                 # Merge features not already in the search card
-                for key in [
-                    'total_area', 'covered_area', 'semi_covered_area',
-                    'uncovered_area', 'bedrooms', 'bathrooms',
-                    'parking_spaces', 'description', 'address', 'neighborhood',
-                ]:
+                for key in _DETAIL_KEYS:
                     if detail_data.get(key) is not None and not card.get(key):
                         card[key] = detail_data[key]
 
-                n_imgs = len(detail_data.get('images', []))
                 enriched += 1
-                print(f"[DEBUG] [zonaprop]   Card {i+1}/{len(to_enrich)}: {n_imgs} images")
+                logger.debug(
+                    "[zonaprop]   Card %d/%d: %d images",
+                    i + 1, len(to_enrich), len(detail_data.get('images', [])),
+                )
 
+        logger.debug("[zonaprop] Enriched %d/%d cards", enriched, len(to_enrich))
+        return cards
+
+    @staticmethod
+    def _is_card_complete(card: Dict[str, Any]) -> bool:
+        """True when a detail-page visit could not add anything useful."""
+        return all(card.get(key) for key in _COMPLETE_CARD_KEYS)
+
+    def _get_detail_data(self, url: str) -> Dict[str, Any]:
+        """Detail data for url, served from the process-wide cache when fresh."""
+        data = _get_cached_detail(url)
+        if data is None:
+            data = self._extract_detail_data(url)
+            if data:
+                _cache_detail(url, data)
+        return data
+
+    def _open_detail_session(self):
+        """Create the keep-alive HTTP session used for detail pages.
+
+        Carries over the Cloudflare cookies and User-Agent of an already
+        warmed driver (a pooled search driver, else the primary one).
+        Returns None when curl_cffi is not installed.
+        """
+        if not HAS_CURL_CFFI:
+            return None
+
+        session = curl_requests.Session(impersonate="chrome")
+        headers = {**BROWSER_HEADERS, "User-Agent": self.user_agent}
+        warmed = next(
+            (d for d in (*self._pool_drivers, self.driver) if d is not None and d in self._cf_warmed),
+            None,
+        )
+        if warmed is not None:
+            try:
+                # cf_clearance is bound to the browser's User-Agent
+                headers["User-Agent"] = warmed.execute_script("return navigator.userAgent")
+                for cookie in warmed.get_cookies():
+                    session.cookies.set(cookie['name'], cookie['value'], domain=cookie.get('domain', ''))
             except Exception as e:
-                logger.debug(f"[zonaprop] Error enriching card {i+1}: {e}")
-                print(f"[DEBUG] [zonaprop]   Card {i+1}/{len(to_enrich)}: ERROR - {e}")
+                logger.debug(f"[zonaprop] Could not copy driver cookies: {e}")
+        else:
+            # No warmed driver this run: fall back to cookies persisted by an earlier one
+            saved = _load_cf_cookies()
+            if saved:
+                headers["User-Agent"] = saved['user_agent']
+                for cookie in saved['cookies']:
+                    session.cookies.set(cookie['name'], cookie['value'], domain=cookie.get('domain', ''))
+        session.headers.update(headers)
+        return session
+
+    def _fetch_detail_html(self, url: str) -> Optional[str]:
+        """Fetch a detail page over HTTP; None if it looks like a challenge page.
+
+        Zonaprop ships the gallery JSON ("url1200x1200") in the initial HTML,
+        so a plain GET is enough unless Cloudflare intervenes. Every attempt
+        takes a token from the shared adaptive limiter: 429/503 responses
+        pause all workers (honoring Retry-After, else exponential backoff
+        with jitter) and slow the rate; clean pages speed it back up.
+        """
+        if self._detail_session is None:
+            return None
+        limiter = self._detail_limiter
 
-            # Rate limit between detail pages (longer delay to avoid CF blocking)
-            if i < len(to_enrich) - 1:
-                time.sleep(4)
+        for attempt in range(self.DETAIL_MAX_RETRIES):
+            limiter.acquire()
+            try:
+                response = self._detail_session.get(url, timeout=15, allow_redirects=True)
+            except Exception as e:
+                logger.debug(f"[zonaprop] Detail HTTP fetch failed for {url}: {e}")
+                return None
+            if response.status_code not in (429, 503):
+                break
+            backoff = _retry_after(response) or min(2 ** attempt + random.uniform(0, 0.5), 30)
+            logger.debug(f"[zonaprop] Detail HTTP {response.status_code} for {url}, retrying in {backoff:.1f}s")
+            limiter.penalize(backoff)
 
-        print(f"[DEBUG] [zonaprop] Enriched {enriched}/{len(to_enrich)} cards")
-        return cards
+        if response.status_code != 200:
+            logger.debug(f"[zonaprop] Detail HTTP fetch for {url}: status={response.status_code}")
+            return None
 
-    def _extract_detail_data(self, url: str) -> Dict[str, Any]:
-        """Extract images and features from a property detail page."""
-        import time
+        html = _decode_content(response.content)
+        if _is_cf_blocked(html):
+            limiter.penalize(random.uniform(1, 2))
+            return None
+        if len(html) < self.DETAIL_MIN_HTML_LENGTH or 'url1200x1200' not in html:
+            return None
+        limiter.reward()
+        return html
 
-        data: Dict[str, Any] = {}
+    def _fetch_detail_with_selenium(self, url: str) -> str:
+        """Fetch a detail page with the browser (Cloudflare fallback).
+
+        Serialized across detail workers. The pause after each page adapts:
+        it shrinks toward SELENIUM_MIN_DELAY while pages load cleanly and
+        doubles (with jitter) when Cloudflare still serves a challenge.
+        """
+        from selenium.common.exceptions import TimeoutException
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support.ui import WebDriverWait
+        from selenium.webdriver.support import expected_conditions as EC
 
-        self.driver.get(url)
-        time.sleep(3)
+        with self._selenium_lock:
+            driver = self._get_driver()
+            try:
+                self._warm_up_driver(driver, delay=3)
+            except Exception as e:
+                logger.debug(f"[zonaprop] Warmup failed: {e}")
 
-        # Scroll to trigger lazy loading
-        try:
-            total_height = self.driver.execute_script("return document.body.scrollHeight")
-            for scroll_pos in range(0, min(total_height, 3000), 500):
-                self.driver.execute_script(f"window.scrollTo(0, {scroll_pos});")
-                time.sleep(0.2)
-            self.driver.execute_script("window.scrollTo(0, 0);")
-            time.sleep(1)
-        except Exception:
-            pass
+            driver.get(url)
+            # Wait only as long as the page needs to render (title or gallery)
+            try:
+                WebDriverWait(driver, self.DETAIL_PAGE_TIMEOUT).until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, _DETAIL_READY_SELECTOR))
+                )
+            except TimeoutException:
+                logger.debug("[zonaprop] Detail page not rendered after %ss: %s", self.DETAIL_PAGE_TIMEOUT, url)
+            html = self._page_source(driver)
+
+            # The gallery JSON is in the initial HTML; only scroll to trigger
+            # lazy loading when it is missing
+            if not self._has_gallery_json(html):
+                try:
+                    total_height = driver.execute_script("return document.body.scrollHeight")
+                    for scroll_pos in range(0, min(total_height, 3000), 500):
+                        driver.execute_script(f"window.scrollTo(0, {scroll_pos});")
+                        time.sleep(0.2)
+                    driver.execute_script("window.scrollTo(0, 0);")
+                    WebDriverWait(driver, self.DETAIL_PAGE_TIMEOUT).until(
+                        lambda d: d.execute_script("return document.readyState") == "complete"
+                    )
+                    html = self._page_source(driver)
+                except Exception:
+                    pass
+
+            if _is_cf_blocked(html):
+                self._selenium_delay = min(30.0, self._selenium_delay * 2 + random.uniform(0, 0.5))
+            else:
+                self._selenium_delay = max(self.SELENIUM_MIN_DELAY, self._selenium_delay * 0.9)
+            time.sleep(self._selenium_delay)
+            return html
 
-        html = self.driver.page_source
-        soup = BeautifulSoup(html, 'html.parser')
+    @staticmethod
+    def _has_gallery_json(html: str, minimum: int = 3) -> bool:
+        """True if html embeds at least `minimum` url1200x1200 entries.
+
+        Stops scanning at the minimum-th match; the full extraction happens
+        once, later, in _extract_detail_images.
+        """
+        return sum(1 for _ in islice(_RE_JSON_IMG.finditer(html), minimum)) >= minimum
+
+    def _extract_detail_data(self, url: str) -> Dict[str, Any]:
+        """Extract images and features from a property detail page."""
+        data: Dict[str, Any] = {}
+
+        html = self._fetch_detail_html(url)
+        if html is None:
+            html = self._fetch_detail_with_selenium(url)
+        soup = BeautifulSoup(html, HTML_PARSER)
 
         # Extract images from gallery container
         images = self._extract_detail_images(soup, html)
@@ -907,85 +1571,76 @@ class ZonapropListingScraper(BaseListingScraper):
                 data['description'] = desc_elem.get_text(strip=True)[:2000]
                 break
 
-        # Extract address from h4 (Zonaprop pattern: "Street 123, Neighborhood, City")
-        for h4 in soup.find_all('h4'):
-            text = h4.get_text(strip=True)
-            if any(loc in text.lower() for loc in ['capital federal', 'buenos aires', ',']):
-                parts = [p.strip() for p in text.split(',') if p.strip()]
-                if parts:
-                    # First part with numbers is usually the address
-                    if any(c.isdigit() for c in parts[0]):
-                        data['address'] = parts[0]
-                    if len(parts) >= 2:
-                        data['neighborhood'] = parts[-2] if len(parts) > 2 else parts[-1]
-                break
+        # Extract address from h4 (Zonaprop pattern: "Street 123, Neighborhood, City");
+        # find() stops at the first matching heading
+        h4 = soup.find(_is_location_h4)
+        if h4 is not None:
+            parts = [p.strip() for p in h4.get_text(strip=True).split(',') if p.strip()]
+            if parts:
+                # First part with numbers is usually the address
+                if any(map(str.isdigit, parts[0])):
+                    data['address'] = parts[0]
+                if len(parts) >= 2:
+                    data['neighborhood'] = parts[-2] if len(parts) > 2 else parts[-1]
 
         return data
 
     def _extract_detail_images(self, soup: BeautifulSoup, html: str) -> List[str]:
-        """Extract all property images from detail page."""
-        images: List[str] = []
-        seen: set = set()
+        """Extract all property images from detail page.
 
-        # Strategy 1: Extract from embedded JavaScript 'pictures' array (has ALL images)
-        # Pattern: "url1200x1200": "https://imgar.zonapropcdn.com/avisos/..."
-        url_matches = re.findall(
-            r'"url1200x1200"\s*:\s*"(https://imgar\.zonapropcdn\.com/avisos/[^"]+)"',
-            html
-        )
+        Scans the raw HTML with precompiled regexes; the parsed soup is only
+        consulted when the HTML holds no listing image URL at all. Every
+        strategy stops as soon as DETAIL_MAX_IMAGES distinct URLs are found.
+        """
+        target = self.DETAIL_MAX_IMAGES
+        images: Dict[str, None] = {}  # order-preserving set
 
-        for url in url_matches:
-            # Skip logos and agency images
-            if '/empresas/' not in url and url not in seen:
-                seen.add(url)
-                images.append(url)
-
-        # Strategy 2: Gallery container with direct img elements (fallback)
-        if len(images) < 3:
-            gallery_selectors = [
-                '#multimedia-content img',
-                '#new-gallery-portal img',
-                '.gallery-multimedia-represh img',
-                '.item-desktop img',
-            ]
+        def collect(urls) -> bool:
+            for url in urls:
+                images[url] = None
+                if len(images) >= target:
+                    return True
+            return False
 
-            for selector in gallery_selectors:
-                for img in soup.select(selector):
-                    for attr in ['src', 'data-src', 'data-lazy']:
-                        url = img.get(attr, '')
-                        if url and 'zonapropcdn.com/avisos/' in url and url not in seen:
-                            if '/empresas/' not in url:
-                                upgraded = self._upgrade_image_url(url)
-                                if upgraded not in seen:
-                                    seen.add(upgraded)
-                                    images.append(upgraded)
-                            break
-                if len(images) >= 3:
-                    break
+        # Strategy 1: Extract from embedded JavaScript 'pictures' array (has ALL images)
+        # Pattern: "url1200x1200": "https://imgar.zonapropcdn.com/avisos/..."
+        # Skip logos and agency images
+        if collect(
+            m.group(1) for m in _RE_JSON_IMG.finditer(html)
+            if '/empresas/' not in m.group(1)
+        ):
+            return list(images)
+
+        # Strategy 2: Any listing image URL in the markup (gallery <img> src/data-src/...)
+        if len(images) < 3 and collect(
+            self._upgrade_image_url(m.group())
+            for m in _RE_ANY_IMG.finditer(html)
+            if '/empresas/' not in m.group() and '100x75' not in m.group()
+        ):
+            return list(images)
+
+        # Strategy 3: Parsed <img> attributes (last resort, e.g. entity-encoded URLs)
+        # Gallery containers first, any <img> if the gallery markup is absent
+        if not images:
+            candidates = (
+                img.get('src') or img.get('data-src') or img.get('data-lazy') or ''
+                for img in soup.select(_GALLERY_IMG_SELECTOR) or soup.find_all('img')
+            )
+            collect(
+                self._upgrade_image_url(url)
+                for url in candidates
+                if 'zonapropcdn.com/avisos/' in url and '/empresas/' not in url and '100x75' not in url
+            )
 
-        # Strategy 3: Any img with zonapropcdn.com/avisos/ URL (last resort)
-        if len(images) < 3:
-            for img in soup.find_all('img'):
-                for attr in ['src', 'data-src']:
-                    url = img.get(attr, '')
-                    if url and 'zonapropcdn.com/avisos/' in url and url not in seen:
-                        if '/empresas/' not in url and '100x75' not in url:
-                            upgraded = self._upgrade_image_url(url)
-                            if upgraded not in seen:
-                                seen.add(upgraded)
-                                images.append(upgraded)
-                        break
-
-        return images[:20]
+        return list(images)
 
     @staticmethod
     def _upgrade_image_url(url: str) -> str:
-        """Upgrade Zonaprop image URL to higher resolution."""
-        # Replace small dimensions with 1200x1200
-        url = re.sub(r'/\d+x\d+/', '/1200x1200/', url)
-        # Also handle resize URLs
-        url = re.sub(r'/resize/(\d+)/', r'/\1/', url)
-        return url
+        """Upgrade Zonaprop image URL to higher resolution.
+
+        Single pass: small dimensions become 1200x1200 and /resize/N/ becomes /N/.
+        """
+        return _RE_IMG_UPGRADE.sub(_upgrade_match, url)
 
     def _extract_detail_features(self, soup: BeautifulSoup) -> Dict[str, Any]:
         """Extract property features from detail page."""
@@ -996,35 +1651,30 @@ class ZonapropListingScraper(BaseListingScraper):
         h2 = soup.find('h2', class_='title-type-sup-property')
         if h2:
             text = h2.get_text().lower()
-            amb_match = re.search(r'(\d+)\s*ambiente', text)
+            amb_match = _RE_AMBIENTES.search(text)
             if amb_match:
                 features['bedrooms'] = int(amb_match.group(1))
-            coch_match = re.search(r'(\d+)\s*cochera', text)
+            coch_match = _RE_COCHERAS.search(text)
             if coch_match:
                 features['parking_spaces'] = int(coch_match.group(1))
-            area_match = re.search(r'(\d+)\s*m', text)
+            area_match = _RE_AREA.search(text)
             if area_match:
                 features['covered_area'] = float(area_match.group(1))
 
-        # Strategy 2: Look for li.icon-feature elements
-        for li in soup.find_all('li', class_='icon-feature'):
-            text = li.get_text().strip().lower()
-            if 'm² tot' in text or 'm2 tot' in text:
-                match = re.search(r'(\d+)', text)
-                if match:
-                    features['total_area'] = float(match.group(1))
-            elif 'm² cub' in text or 'm2 cub' in text:
-                match = re.search(r'(\d+)', text)
-                if match:
-                    features['covered_area'] = float(match.group(1))
-            elif 'baño' in text:
-                match = re.search(r'(\d+)', text)
-                if match:
-                    features['bathrooms'] = int(match.group(1))
-            elif 'dormitorio' in text:
-                match = re.search(r'(\d+)', text)
-                if match:
-                    features['bedrooms'] = int(match.group(1))
+        # Strategy 2: Look for li.icon-feature elements ("120 m² tot.", "2 baños", ...)
+        for li in soup.select('li.icon-feature'):
+            match = _RE_ICON_FEATURE.search(li.get_text().lower())
+            if not match:
+                continue
+            value, kind = match.group(1), match.group(2)
+            if kind.endswith('tot'):
+                features['total_area'] = float(value)
+            elif kind.endswith('cub'):
+                features['covered_area'] = float(value)
+            elif kind == 'baño':
+                features['bathrooms'] = int(value)
+            else:
+                features['bedrooms'] = int(value)
 
         # Strategy 3: Look for mainFeatures in JavaScript
         # Pattern: 'mainFeatures': { "CFT100": { ... "value": "45" ...
@@ -10,17 +10,406 @@ Note: ML Items API via client_credentials does not grant item-read permission fo
 real estate listings (always returns 403). HTML parsing is the only viable strategy.
 """
 import re
+import os
 import json
 import asyncio
+import copy
 import time
+import atexit
+import shutil
 import logging
-from typing import Dict, Any, List, Optional
+import queue
+import threading
+import importlib.util
+from typing import Dict, Any, List, Optional, Tuple
 from urllib.parse import urlparse
 from .base import BaseScraper
-from .utils import clean_price as _clean_price
+from .utils import BLOCKED_RESOURCE_URLS, clean_price as _clean_price, json_loads
 
 logger = logging.getLogger(__name__)
 
+# Chrome/Chromium executables the Selenium fallback can drive
+_CHROME_BINARIES = ('google-chrome', 'google-chrome-stable', 'chromium', 'chromium-browser', 'chrome')
+
+# Probed once per process by _chrome_available()
+_CHROME_AVAILABLE: Optional[bool] = None
+
+# Optional Selenium Grid / selenium/standalone-chrome endpoint, e.g.
+# http://selenium:4444/wd/hub. When set, pooled drivers are sessions on that
+# long-running server instead of a local chromedriver + Chrome per driver.
+SELENIUM_REMOTE_URL = os.environ.get('SELENIUM_REMOTE_URL', '').strip() or None
+
+# Markers of a real product page, most common first so any() stops early
+_ML_PAGE_MARKERS = ('ui-pdp', 'andes-money-amount', 'application/ld+json', 'mercadolibre', 'ui-vip')
+
+# Listing id in the item URL, e.g. .../MLA-123456789-departamento-...
+_RE_MLA_ID = re.compile(r'MLA-?(\d+)')
+
+# "Av. Santa Fe 3200" / "Santa Fe al 3200" -> street, number
+_RE_STREET_NUMBER = re.compile(r'^(.+?)\s+(?:Al\s+)?(\d+)\s*$', re.IGNORECASE)
+
+# Neighborhoods recognised in the title when the location block is missing
+_RE_TITLE_NEIGHBORHOOD = re.compile(
+    r'(Palermo|Belgrano|Recoleta|Caballito|Villa Crespo|Colegiales|Núñez|Almagro|San Telmo|La Boca)',
+    re.IGNORECASE,
+)
+
+# Body of each <script type="application/ld+json"> in the raw HTML. Script
+# contents are raw text (no entities), so this yields what script.string would.
+_RE_LD_JSON_SCRIPT = re.compile(
+    r'<script\b[^>]*\btype\s*=\s*["\']?application/ld\+json["\']?[^>]*>(.*?)</script\s*>',
+    re.IGNORECASE | re.DOTALL,
+)
+
+# Image size suffix (-O.jpg, -V.webp, ...) upgraded to the full-size variant -F
+_RE_IMG_SIZE = re.compile(r'-[A-Z]\.(\w+)$')
+
+# Non-listing images (UI assets, placeholders, logos), matched on the lowercased URL
+_RE_IMG_SKIP = re.compile(r'frontend-assets|default|exhibitor|placeholder|logo|\.svg')
+
+# Gallery <img> filters in priority order, equivalent to the CSS selectors
+#   figure img[src*="mlstatic"], figure img[data-src*="mlstatic"],
+#   img[class*="ui-pdp-image"][src*="mlstatic"], img[data-zoom*="mlstatic"],
+#   img[src*="http2.mlstatic.com/D_"], img[data-src*="http2.mlstatic.com/D_"]
+# applied to the page's <img> list (bs4 keeps class as a list, hence the join)
+_GALLERY_IMG_FILTERS = (
+    lambda img: 'mlstatic' in img.get('src', '') and img.find_parent('figure') is not None,
+    lambda img: 'mlstatic' in img.get('data-src', '') and img.find_parent('figure') is not None,
+    lambda img: 'mlstatic' in img.get('src', '') and 'ui-pdp-image' in ' '.join(img.get('class') or ()),
+    lambda img: 'mlstatic' in img.get('data-zoom', ''),
+    lambda img: 'http2.mlstatic.com/D_' in img.get('src', ''),
+    lambda img: 'http2.mlstatic.com/D_' in img.get('data-src', ''),
+)
+
+# First number in a spec row (decimal for areas, integer for counts)
+_RE_DECIMAL = re.compile(r'(\d+(?:[.,]\d+)?)')
+_RE_INTEGER = re.compile(r'(\d+)')
+
+# Spec-row dispatch: (field, row keywords, number pattern, type), first match per field wins
+_SPEC_FIELDS = (
+    ('total_area', ('superficie total', 'sup. total'), _RE_DECIMAL, float),
+    ('covered_area', ('superficie cubierta', 'sup. cubierta', 'cubiertos'), _RE_DECIMAL, float),
+    ('bedrooms', ('dormitorio', 'habitaci', 'ambiente'), _RE_INTEGER, int),
+    ('bathrooms', ('baño',), _RE_INTEGER, int),
+    ('parking_spaces', ('cochera', 'estacionamiento'), _RE_INTEGER, int),
+)
+
+# Feature counts and areas in free page text, matched in a single finditer pass
+# over the cached lowercase text (cheaper than IGNORECASE on the original).
+# Only one group per match is set; the first match for each field wins.
+_RE_TEXT_FEATURES = re.compile(
+    r'(?P<bedrooms>\d+)\s*(?:dormitorio|ambiente)'
+    r'|(?P<bathrooms>\d+)\s*baño'
+    r'|(?P<parking_spaces>\d+)\s*cochera'
+    r'|(?P<total_area>\d+(?:[.,]\d+)?)\s*m[²2]?\s*totales?'
+    r'|(?P<covered_area>\d+(?:[.,]\d+)?)\s*m[²2]?\s*cubiertos?'
+)
+_TEXT_AREA_FIELDS = ('total_area', 'covered_area')
+
+# Amenity keywords searched in the (lowercased) description, in reporting order.
+# Plain `in` scans: CPython's substring search beats a regex alternation here.
+_AMENITY_KEYWORDS = (
+    'pileta', 'piscina', 'gimnasio', 'seguridad', 'parrilla',
+    'balcón', 'terraza', 'jardín', 'quincho', 'sum', 'laundry',
+)
+
+# (keyword, value) pairs checked in order against the lowercased h1 title when
+# the URL (see the *_URL_PATTERNS below) names no type
+_PROPERTY_TYPE_KEYWORDS = (
+    ('departamento', 'departamento'), ('depto', 'departamento'),
+    ('casa', 'casa'),
+    ('ph', 'ph'),
+    ('terreno', 'terreno'), ('lote', 'terreno'),
+    ('local', 'local'), ('comercial', 'local'),
+    ('oficina', 'oficina'),
+)
+_OPERATION_TYPE_KEYWORDS = (
+    ('alquiler-temporal', 'alquiler_temporal'), ('temporal', 'alquiler_temporal'),
+    ('alquiler', 'alquiler'),
+    ('venta', 'venta'),
+)
+
+# The same tables for the URL, where a keyword must be a whole word of the
+# subdomain/slug ('-', '_', '.', '/' delimited): "-phone-" is not a PH and
+# "-localidad-" is not a local. Same order, so the same priority.
+_PROPERTY_TYPE_URL_PATTERNS = tuple(
+    (re.compile(rf'(?<![a-z0-9]){re.escape(keyword)}(?![a-z0-9])'), value)
+    for keyword, value in _PROPERTY_TYPE_KEYWORDS
+)
+_OPERATION_TYPE_URL_PATTERNS = tuple(
+    (re.compile(rf'(?<![a-z0-9]){re.escape(keyword)}(?![a-z0-9])'), value)
+    for keyword, value in _OPERATION_TYPE_KEYWORDS
+)
+
+# Elements whose class contains "price" (any case), for the HTML price/currency fallbacks
+_PRICE_SPAN_SELECTOR = 'span[class*="price" i]'
+_PRICE_DIV_SELECTOR = 'div[class*="price" i]'
+
+# Status keywords searched in the (lowercased) page text
+_REMOVED_KEYWORDS = (
+    'finalizada', 'finalizó', 'finalizo',
+    'publicación ya finalizó', 'publicacion ya finalizo',
+    'esta publicación finalizó', 'vencida',
+)
+_SOLD_KEYWORDS = ('vendido', 'vendida', 'sold', 'no disponible', 'pausado')
+_RENTED_KEYWORDS = ('alquilado', 'alquilada', 'rented')
+_RESERVED_KEYWORDS = ('reservado', 'reservada', 'reserved')
+
+# Sold/rented/reserved are only trusted near the top of the page (header badge)
+_STATUS_HEAD_CHARS = 500
+
+# Status badge candidates, checked in order
+_STATUS_SELECTORS = (
+    '.ui-pdp-header__status',
+    '[class*="status"]',
+    '.ui-pdp-badge',
+)
+
+
+# Process-wide cache of scraped listings: source_url -> (stored_at, data).
+# Kept short so price updates stay current; it absorbs back-to-back scrapes of
+# the same listing (preview then save). Bulk re-scrapes pass use_cache=False so
+# they always read the live page (their fresh results still refresh the cache).
+SCRAPE_CACHE_TTL = 10 * 60
+SCRAPE_CACHE_MAX_ENTRIES = 500
+_scrape_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+_scrape_cache_lock = threading.Lock()
+
+
+def _get_cached_scrape(url: str) -> Optional[Dict[str, Any]]:
+    """Return a copy of the cached scrape result for url if still fresh."""
+    with _scrape_cache_lock:
+        entry = _scrape_cache.get(url)
+        if entry is None:
+            return None
+        stored_at, data = entry
+        if time.monotonic() - stored_at > SCRAPE_CACHE_TTL:
+            del _scrape_cache[url]
+            return None
+    return copy.deepcopy(data)
+
+
+def _cache_scrape(url: str, data: Dict[str, Any]) -> None:
+    """Store a copy of data for url, evicting the oldest entry when full."""
+    data = copy.deepcopy(data)
+    with _scrape_cache_lock:
+        _scrape_cache.pop(url, None)
+        if len(_scrape_cache) >= SCRAPE_CACHE_MAX_ENTRIES:
+            del _scrape_cache[next(iter(_scrape_cache))]
+        _scrape_cache[url] = (time.monotonic(), data)
+
+
+def _chrome_available() -> bool:
+    """Whether selenium and a Chrome binary (or remote server) are available (probed once, then cached)."""
+    global _CHROME_AVAILABLE
+    if _CHROME_AVAILABLE is None:
+        _CHROME_AVAILABLE = (
+            importlib.util.find_spec('selenium') is not None
+            and (SELENIUM_REMOTE_URL is not None or any(shutil.which(name) for name in _CHROME_BINARIES))
+        )
+        if not _CHROME_AVAILABLE:
+            logger.info("[mercadolibre] Chrome/selenium not found, Selenium fallback disabled")
+    return _CHROME_AVAILABLE
+
+
+# Chrome flags for the Selenium fallback (headless, anti-bot), applied once per launch
+_CHROME_ARGUMENTS = (
+    "--headless=new",
+    "--no-sandbox",
+    "--disable-dev-shm-usage",
+    "--disable-blink-features=AutomationControlled",
+    "user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+    "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+)
+
+# Downloads the fallback never needs: extraction reads JSON-LD and <img> attributes,
+# which are in the DOM whether or not the bytes are fetched, and no layout is
+# waited on, so stylesheets go too
+_BLOCKED_RESOURCE_URLS = BLOCKED_RESOURCE_URLS + ['*.css']
+
+# Chrome pool shared by every MercadoLibreScraper in the process. Launching
+# Chrome costs seconds, so drivers are reused across URLs (state reset between
+# pages) and only recycled after SELENIUM_MAX_PAGES pages, since long-lived
+# Chrome grows memory and gets flaky.
+SELENIUM_POOL_SIZE = 2  # Max Chrome instances fetching detail pages at once
+SELENIUM_MAX_PAGES = 25
+SELENIUM_CONTENT_TIMEOUT = 10
+
+# Nodes that mean the listing has rendered (JSON-LD, location, price)
+_SELENIUM_READY_SELECTORS = (
+    'script[type="application/ld+json"]',
+    '.ui-vip-location__subtitle',
+    'span.andes-money-amount__fraction',
+)
+# Serialises the rendered page without inline scripts/styles (ML inlines
+# hundreds of KB of app state). Nothing downstream reads them: JSON-LD scripts
+# are kept and get_text() skips script/style anyway, so the extractors see the
+# same data while far less HTML crosses the WebDriver wire and goes through bs4.
+_SELENIUM_PAGE_HTML_JS = """
+document.querySelectorAll('script:not([type="application/ld+json"]), style')
+    .forEach(function (node) { node.remove(); });
+return document.documentElement.outerHTML;
+"""
+
+_idle_drivers: "queue.LifoQueue" = queue.LifoQueue()  # (driver, pages served); LIFO keeps one warm
+_pool_drivers: List[Any] = []
+_pool_lock = threading.Lock()
+
+
+def _new_chrome_driver():
+    """Launch a configured headless Chrome. Raises RuntimeError if unavailable."""
+    try:
+        from selenium import webdriver
+        from selenium.webdriver.chrome.options import Options
+    except ImportError:
+        raise RuntimeError(
+            "[mercadolibre] selenium not installed — cannot use Selenium fallback"
+        )
+
+    options = Options()
+    for argument in _CHROME_ARGUMENTS:
+        options.add_argument(argument)
+    options.add_experimental_option("excludeSwitches", ["enable-automation"])
+    options.add_experimental_option("useAutomationExtension", False)
+    options.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2})
+
+    try:
+        if SELENIUM_REMOTE_URL:
+            from selenium.webdriver.chromium.remote_connection import ChromiumRemoteConnection
+            # One keep-alive HTTP connection per pooled session (each driver is
+            # used by one thread at a time); the goog vendor prefix keeps the
+            # CDP endpoint below available on the remote session.
+            executor = ChromiumRemoteConnection(
+                SELENIUM_REMOTE_URL, vendor_prefix='goog', browser_name='chrome', keep_alive=True
+            )
+            driver = webdriver.Remote(command_executor=executor, options=options)
+        else:
+            driver = webdriver.Chrome(options=options)
+    except Exception as e:
+        raise RuntimeError(f"[mercadolibre] Chrome not available: {e}")
+
+    # Registered once, runs on every document this driver loads
+    _execute_cdp(driver, "Page.addScriptToEvaluateOnNewDocument", {
+        "source": "Object.defineProperty(navigator, 'webdriver', {get: () => undefined})"
+    })
+    try:
+        _execute_cdp(driver, 'Network.enable', {})
+        _execute_cdp(driver, 'Network.setBlockedURLs', {'urls': _BLOCKED_RESOURCE_URLS})
+    except Exception as e:
+        logger.debug("[mercadolibre] Could not block resources: %s", e)
+    return driver
+
+
+def _execute_cdp(driver, cmd: str, params: Dict[str, Any]) -> Any:
+    """Run a Chrome DevTools command on a local or remote (Grid) Chrome session."""
+    # Same command Chrome.execute_cdp_cmd sends; webdriver.Remote has no such method
+    return driver.execute("executeCdpCommand", {"cmd": cmd, "params": params})["value"]
+
+
+def _acquire_driver() -> Tuple[Any, int]:
+    """Borrow an idle driver, launching one while below SELENIUM_POOL_SIZE (blocking)."""
+    while True:
+        try:
+            return _idle_drivers.get_nowait()
+        except queue.Empty:
+            pass
+        with _pool_lock:
+            launch = len(_pool_drivers) < SELENIUM_POOL_SIZE
+            if launch:
+                _pool_drivers.append(None)  # reserve the slot while Chrome starts
+        if launch:
+            try:
+                driver = _new_chrome_driver()
+            except Exception:
+                with _pool_lock:
+                    _pool_drivers.remove(None)
+                raise
+            with _pool_lock:
+                _pool_drivers[_pool_drivers.index(None)] = driver
+            return driver, 0
+        try:
+            # Re-check periodically: a discarded driver frees a launch slot
+            return _idle_drivers.get(timeout=1.0)
+        except queue.Empty:
+            continue
+
+
+def _discard_driver(driver) -> None:
+    """Quit a driver and free its pool slot."""
+    try:
+        driver.quit()
+    except Exception:
+        pass
+    with _pool_lock:
+        if driver in _pool_drivers:
+            _pool_drivers.remove(driver)
+
+
+def _release_driver(driver, pages: int) -> None:
+    """Reset a driver's state and return it to the pool, or recycle it if worn out."""
+    if pages >= SELENIUM_MAX_PAGES:
+        _discard_driver(driver)
+        return
+    try:
+        driver.delete_all_cookies()
+        driver.get("about:blank")
+    except Exception:
+        _discard_driver(driver)
+        return
+    _idle_drivers.put((driver, pages))
+
+
+def _quit_all_drivers() -> None:
+    """Quit every pooled Chrome (registered with atexit)."""
+    while True:
+        try:
+            _idle_drivers.get_nowait()
+        except queue.Empty:
+            break
+    with _pool_lock:
+        drivers = [d for d in _pool_drivers if d is not None]
+    for driver in drivers:
+        _discard_driver(driver)
+
+
+atexit.register(_quit_all_drivers)
+
+
+def _selenium_page_source(url: str) -> str:
+    """Load url in a pooled Chrome and return its HTML (blocking)."""
+    try:
+        from selenium.webdriver.support.ui import WebDriverWait
+        from selenium.webdriver.support import expected_conditions as EC
+        from selenium.webdriver.common.by import By
+        from selenium.common.exceptions import TimeoutException
+    except ImportError:
+        raise RuntimeError(
+            "[mercadolibre] selenium not installed — cannot use Selenium fallback"
+        )
+
+    driver, pages = _acquire_driver()
+    try:
+        driver.get(url)
+        WebDriverWait(driver, 15).until(
+            EC.presence_of_element_located((By.TAG_NAME, "body"))
+        )
+        # Return as soon as any node the extractors read has rendered
+        try:
+            WebDriverWait(driver, SELENIUM_CONTENT_TIMEOUT).until(EC.any_of(*(
+                EC.presence_of_element_located((By.CSS_SELECTOR, selector))
+                for selector in _SELENIUM_READY_SELECTORS
+            )))
+        except TimeoutException:
+            logger.warning(f"[mercadolibre] Selenium: no listing content after "
+                           f"{SELENIUM_CONTENT_TIMEOUT}s, using page as loaded")
+        html = driver.execute_script(_SELENIUM_PAGE_HTML_JS)
+    except Exception:
+        # A crashed or wedged browser is replaced on the next acquire
+        _discard_driver(driver)
+        raise
+    _release_driver(driver, pages + 1)
+    return html
+
 
 class MercadoLibreScraper(BaseScraper):
     """
@@ -33,6 +422,20 @@ class MercadoLibreScraper(BaseScraper):
 
     DOMAINS = ["mercadolibre.com.ar"]
 
+    # Per-parse caches (see _reset_parse_caches); no per-instance __dict__
+    __slots__ = (
+        'use_cache',
+        '_page_text', '_page_text_lower', '_html_title',
+        '_description', '_json_ld', '_json_ld_parsed', '_location_text',
+        '_ld_json_blobs',
+    )
+
+    def __init__(self, url: str, user_agent: Optional[str] = None, session=None, use_cache: bool = True):
+        super().__init__(url, user_agent, session)
+        # False skips the _scrape_cache lookup (bulk price updates and re-scrapes)
+        self.use_cache = use_cache
+        self._reset_parse_caches()
+
     def validate_url(self) -> bool:
         """Check if URL is from MercadoLibre"""
         parsed = urlparse(self.url)
@@ -46,15 +449,25 @@ class MercadoLibreScraper(BaseScraper):
         if not self.validate_url():
             raise ValueError(f"URL not from MercadoLibre: {self.url}")
 
+        cached = _get_cached_scrape(self.url) if self.use_cache else None
+        if cached is not None:
+            logger.info(f"[mercadolibre] cache hit for {self.url[:80]}")
+            return cached
+
+        html = None
         try:
             html = await self.fetch_page()
-            if html:
-                self.parse_html(html)
         except Exception as e:
             logger.warning(f"[mercadolibre] HTML fetch failed (non-fatal): {e}")
 
-        data = self.extract_data()
+        # Parsing + extraction is CPU-bound bs4 work: one thread hop keeps the
+        # event loop free (splitting extractors across threads would only contend
+        # for the GIL and race on the per-parse caches)
+        data = await asyncio.to_thread(self._parse_and_extract, html)
         data['source_url'] = self.url
+        # Only real pages are cached; a failed fetch should be retried next time
+        if self.soup is not None and data.get('price') is not None:
+            _cache_scrape(self.url, data)
 
         logger.info(
             f"[mercadolibre] extracted price={data.get('price')}, "
@@ -62,6 +475,15 @@ class MercadoLibreScraper(BaseScraper):
         )
         return data
 
+    def _parse_and_extract(self, html: Optional[str]) -> Dict[str, Any]:
+        """Parse the fetched HTML (if any) and run every extractor (blocking)."""
+        if html:
+            try:
+                self.parse_html(html)
+            except Exception as e:
+                logger.warning(f"[mercadolibre] HTML parse failed (non-fatal): {e}")
+        return self.extract_data()
+
     async def fetch_page(self) -> str:
         """
         Fetch page HTML.
@@ -79,66 +501,88 @@ class MercadoLibreScraper(BaseScraper):
         except Exception as e:
             logger.warning(f"[mercadolibre] HTTP fetch failed: {e}, trying Selenium...")
 
-        # Level 2: Selenium fallback
+        # Level 2: Selenium fallback (skipped without a thread hop when Chrome is missing)
+        if not _chrome_available():
+            raise RuntimeError("[mercadolibre] Chrome not available — no Selenium fallback")
         return await asyncio.to_thread(self._fetch_with_selenium)
 
+    def parse_html(self, html: str) -> None:
+        super().parse_html(html)
+        self._reset_parse_caches()
+        # One C-level scan of the raw HTML instead of a find_all walk of the soup
+        self._ld_json_blobs = _RE_LD_JSON_SCRIPT.findall(html)
+
+    def _reset_parse_caches(self) -> None:
+        """Forget everything derived from the previous soup."""
+        self._page_text: Optional[str] = None
+        self._page_text_lower: Optional[str] = None
+        self._html_title: Optional[str] = None
+        self._description: Optional[str] = None
+        self._json_ld: Optional[Dict[str, Any]] = None
+        self._json_ld_parsed = False
+        self._location_text: Optional[str] = None
+        self._ld_json_blobs: List[str] = []
+
+    def _get_page_text(self) -> str:
+        """
+        Visible page text, extracted once per parse (features and status both scan it).
+        Only <body> is walked; get_text() already skips script/style contents.
+        """
+        if self._page_text is None:
+            root = self.soup.body or self.soup
+            self._page_text = root.get_text()
+        return self._page_text
+
+    def _get_page_text_lower(self) -> str:
+        """Lowercased _get_page_text, shared by the status keywords and feature regexes."""
+        if self._page_text_lower is None:
+            self._page_text_lower = self._get_page_text().lower()
+        return self._page_text_lower
+
+    def _get_html_title(self) -> str:
+        """h1 title, looked up once per parse (type, operation and location reuse it)."""
+        if self._html_title is None:
+            h1 = self.soup.find('h1') if self.soup else None
+            self._html_title = h1.get_text(strip=True) if h1 else "Propiedad sin título"
+        return self._html_title
+
+    def _get_location_text(self) -> str:
+        """Location subtitle text, looked up once per parse (location and address both split it)."""
+        if self._location_text is None:
+            location_elem = self.soup.select_one('.ui-vip-location__subtitle') if self.soup else None
+            self._location_text = location_elem.get_text(strip=True) if location_elem else ""
+        return self._location_text
+
+    def _match_type_keyword(
+        self,
+        url_patterns: Tuple[Tuple["re.Pattern", str], ...],
+        keywords: Tuple[Tuple[str, str], ...],
+    ) -> Optional[str]:
+        """
+        Value of the first pattern matching a whole word of the URL, else of the
+        first keyword found in the h1 title. ML URLs usually carry the type in
+        the subdomain or slug (departamento.mercadolibre.com.ar/...-venta-...),
+        so most pages never need the title lookup.
+        """
+        url = self.url.lower()
+        value = next((value for pattern, value in url_patterns if pattern.search(url)), None)
+        if value is None:
+            title = self._get_html_title().lower()
+            value = next((value for keyword, value in keywords if keyword in title), None)
+        return value
+
     def _is_ml_product_page(self, html: str) -> bool:
         """Check the fetched HTML actually contains ML product content."""
-        return any(marker in html for marker in [
-            'ui-pdp', 'andes-money-amount', 'application/ld+json',
-            'mercadolibre', 'ui-vip',
-        ])
+        return any(marker in html for marker in _ML_PAGE_MARKERS)
 
     def _fetch_with_selenium(self) -> str:
         """
         Fetch page using Chrome headless with anti-bot flags.
         Raises RuntimeError if Chrome/ChromeDriver is not installed.
         """
-        try:
-            from selenium import webdriver
-            from selenium.webdriver.chrome.options import Options
-            from selenium.webdriver.support.ui import WebDriverWait
-            from selenium.webdriver.support import expected_conditions as EC
-            from selenium.webdriver.common.by import By
-        except ImportError:
-            raise RuntimeError(
-                "[mercadolibre] selenium not installed — cannot use Selenium fallback"
-            )
-
-        options = Options()
-        options.add_argument("--headless=new")
-        options.add_argument("--no-sandbox")
-        options.add_argument("--disable-dev-shm-usage")
-        options.add_argument("--disable-blink-features=AutomationControlled")
-        options.add_experimental_option("excludeSwitches", ["enable-automation"])
-        options.add_experimental_option("useAutomationExtension", False)
-        options.add_argument(
-            "user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-            "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-        )
-
-        try:
-            driver = webdriver.Chrome(options=options)
-        except Exception as e:
-            raise RuntimeError(f"[mercadolibre] Chrome not available: {e}")
-
-        try:
-            driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {
-                "source": "Object.defineProperty(navigator, 'webdriver', {get: () => undefined})"
-            })
-            driver.get(self.url)
-            from selenium.webdriver.support.ui import WebDriverWait
-            from selenium.webdriver.support import expected_conditions as EC
-            from selenium.webdriver.common.by import By
-            WebDriverWait(driver, 15).until(
-                EC.presence_of_element_located((By.TAG_NAME, "body"))
-            )
-            time.sleep(3)
-            html = driver.page_source
-            logger.info(f"[mercadolibre] Selenium OK, length: {len(html)}")
-            return html
-        finally:
-            driver.quit()
+        html = _selenium_page_source(self.url)
+        logger.info(f"[mercadolibre] Selenium OK, length: {len(html)}")
+        return html
 
     def extract_data(self) -> Dict[str, Any]:
         """Extract all property data from HTML and JSON-LD."""
@@ -172,16 +616,23 @@ class MercadoLibreScraper(BaseScraper):
         JSON-LD can be a single object OR an array of objects — both are valid.
         Accepts any @type that contains an offers.price (ML real estate uses
         @type Offer or Product, not always Product).
+        The result (including "not found") is cached per parse.
         """
         if not self.soup:
             return None
 
-        scripts = self.soup.find_all('script', type='application/ld+json')
-        for script in scripts:
-            if not script.string:
+        if not self._json_ld_parsed:
+            self._json_ld = self._find_json_ld()
+            self._json_ld_parsed = True
+        return self._json_ld
+
+    def _find_json_ld(self) -> Optional[Dict[str, Any]]:
+        """Decode the ld+json scripts and return the first usable item."""
+        for blob in self._ld_json_blobs:
+            if not blob:
                 continue
             try:
-                data = json.loads(script.string)
+                data = json_loads(blob)
                 # Normalise to list so both formats are handled identically
                 candidates = data if isinstance(data, list) else [data]
                 for item in candidates:
@@ -205,21 +656,21 @@ class MercadoLibreScraper(BaseScraper):
             return api['title']
         if json_ld and 'name' in json_ld:
             return json_ld['name']
-        h1 = self.soup.find('h1') if self.soup else None
-        if h1:
-            return h1.get_text(strip=True)
-        return "Propiedad sin título"
+        return self._get_html_title()
 
     def _extract_description(self) -> str:
-        """Extract property description from HTML."""
-        if self.soup:
-            for selector in ['.ui-pdp-description__content', '[class*="description"]', '#description']:
-                desc_elem = self.soup.select_one(selector)
-                if desc_elem:
-                    desc = desc_elem.get_text(strip=True)
-                    if len(desc) > 50:
-                        return desc
-        return ""
+        """Extract property description from HTML (cached per parse)."""
+        if self._description is None:
+            self._description = ""
+            if self.soup:
+                for selector in ['.ui-pdp-description__content', '[class*="description"]', '#description']:
+                    desc_elem = self.soup.select_one(selector)
+                    if desc_elem:
+                        desc = desc_elem.get_text(strip=True)
+                        if len(desc) > 50:
+                            self._description = desc
+                            break
+        return self._description
 
     def _extract_price(self, api: Optional[Dict[str, Any]], json_ld: Optional[Dict[str, Any]]) -> Optional[float]:
         """
@@ -247,8 +698,8 @@ class MercadoLibreScraper(BaseScraper):
             logger.warning(f"[mercadolibre] _extract_price: no price found for {self.url[:80]}")
             return None
 
-        price_spans = self.soup.find_all('span', class_=lambda x: x and 'price' in str(x).lower())
-        for span in price_spans:
+        # Lazy selector match: stops walking the tree at the first usable span
+        for span in self.soup.css.iselect(_PRICE_SPAN_SELECTOR):
             price_amount, _ = _clean_price(span.get_text(strip=True))
             if price_amount:
                 return price_amount
@@ -295,8 +746,7 @@ class MercadoLibreScraper(BaseScraper):
             if 'AR$' in sym or '$' in sym:
                 return 'ARS'
 
-        price_divs = self.soup.find_all('div', class_=lambda x: x and 'price' in str(x).lower())
-        for div in price_divs:
+        for div in self.soup.css.iselect(_PRICE_DIV_SELECTOR):
             text = div.get_text()
             if 'US$' in text or 'USD' in text:
                 return "USD"
@@ -307,39 +757,11 @@ class MercadoLibreScraper(BaseScraper):
 
     def _extract_property_type(self) -> str:
         """Extract property type"""
-        title = self._extract_title(None, None).lower()
-        url_lower = self.url.lower()
-        combined = f"{title} {url_lower}"
-
-        if 'departamento' in combined or 'depto' in combined:
-            return "departamento"
-        elif 'casa' in combined:
-            return "casa"
-        elif 'ph' in combined:
-            return "ph"
-        elif 'terreno' in combined or 'lote' in combined:
-            return "terreno"
-        elif 'local' in combined or 'comercial' in combined:
-            return "local"
-        elif 'oficina' in combined:
-            return "oficina"
-
-        return "casa"
+        return self._match_type_keyword(_PROPERTY_TYPE_URL_PATTERNS, _PROPERTY_TYPE_KEYWORDS) or "casa"
 
     def _extract_operation_type(self) -> str:
         """Extract operation type"""
-        url_lower = self.url.lower()
-        title = self._extract_title(None, None).lower()
-        combined = f"{url_lower} {title}"
-
-        if 'alquiler-temporal' in combined or 'temporal' in combined:
-            return "alquiler_temporal"
-        elif 'alquiler' in combined:
-            return "alquiler"
-        elif 'venta' in combined:
-            return "venta"
-
-        return "venta"
+        return self._match_type_keyword(_OPERATION_TYPE_URL_PATTERNS, _OPERATION_TYPE_KEYWORDS) or "venta"
 
     def _extract_location(self) -> Dict[str, Any]:
         """Extract location data"""
@@ -350,28 +772,19 @@ class MercadoLibreScraper(BaseScraper):
         if not self.soup:
             return {"neighborhood": neighborhood, "city": city, "province": province}
 
-        location_elem = self.soup.select_one('.ui-vip-location__subtitle')
-        if location_elem:
-            location_text = location_elem.get_text(strip=True)
+        location_text = self._get_location_text()
+        if location_text:
             # Format: "Armenia Al 2100, Palermo, Capital Federal, Capital Federal"
             parts = [p.strip() for p in location_text.split(',')]
 
-            if len(parts) >= 2:
-                neighborhood = parts[1] if len(parts) > 1 else parts[0]
-
-            if len(parts) >= 3:
-                city = parts[2]
-
-            if len(parts) >= 4:
-                province = parts[3]
+            # Segments after the street override the defaults in order
+            found = parts[1:4]
+            neighborhood, city, province = found + [neighborhood, city, province][len(found):]
 
         # Fallback: extract from title
         if not neighborhood:
-            title = self._extract_title(None, None)
-            match = re.search(
-                r'(Palermo|Belgrano|Recoleta|Caballito|Villa Crespo|Colegiales|Núñez|Almagro|San Telmo|La Boca)',
-                title, re.IGNORECASE
-            )
+            title = self._get_html_title()
+            match = _RE_TITLE_NEIGHBORHOOD.search(title)
             if match:
                 neighborhood = match.group(1)
 
@@ -395,9 +808,8 @@ class MercadoLibreScraper(BaseScraper):
         if not self.soup:
             return result
 
-        location_elem = self.soup.select_one('.ui-vip-location__subtitle')
-        if location_elem:
-            location_text = location_elem.get_text(strip=True)
+        location_text = self._get_location_text()
+        if location_text:
             parts = location_text.split(',')
             if parts:
                 address = parts[0].strip()
@@ -412,7 +824,7 @@ class MercadoLibreScraper(BaseScraper):
             return
 
         # Pattern: "Street Name Al 1234" or "Street Name 1234" or "Av. Street 1234"
-        match = re.match(r'^(.+?)\s+(?:Al\s+)?(\d+)\s*$', address, re.IGNORECASE)
+        match = _RE_STREET_NUMBER.match(address)
         if match:
             result['street'] = match.group(1).strip()
             result['street_number'] = match.group(2)
@@ -429,13 +841,13 @@ class MercadoLibreScraper(BaseScraper):
         seen = set()
 
         def _add(url: str) -> None:
-            if url and url not in seen:
-                lower = url.lower()
-                if any(skip in lower for skip in ['frontend-assets', 'default', 'exhibitor', 'placeholder', 'logo', '.svg']):
-                    return
-                seen.add(url)
-                # Upgrade ML image resolution: -O (small) -> -F (full size)
-                upgraded = re.sub(r'-[A-Z]\.(\w+)$', r'-F.\1', url)
+            if not url or _RE_IMG_SKIP.search(url.lower()):
+                return
+            # Upgrade ML image resolution: -O (small) -> -F (full size).
+            # Dedup on the upgraded URL so -O/-V variants of one picture count once.
+            upgraded = _RE_IMG_SIZE.sub(r'-F.\1', url)
+            if upgraded not in seen:
+                seen.add(upgraded)
                 images.append(upgraded)
 
         # Strategy 1: ML API pictures array
@@ -453,17 +865,18 @@ class MercadoLibreScraper(BaseScraper):
             elif isinstance(img_data, str):
                 _add(img_data)
 
-        # Strategy 3: HTML img tags from gallery/carousel
-        if self.soup:
-            for selector in [
-                'figure img[src*="mlstatic"]',
-                'figure img[data-src*="mlstatic"]',
-                'img[class*="ui-pdp-image"][src*="mlstatic"]',
-                'img[data-zoom*="mlstatic"]',
-                'img[src*="http2.mlstatic.com/D_"]',
-                'img[data-src*="http2.mlstatic.com/D_"]',
-            ]:
-                for img in self.soup.select(selector):
+        # Strategies 3 and 4 share one walk over the <img> tags; the selector
+        # filters below then run over that short list instead of each one
+        # re-walking the whole document.
+        img_tags = self.soup.find_all('img') if self.soup else []
+
+        # Strategy 3: HTML img tags from gallery/carousel, in the same priority
+        # order the gallery selectors used to be tried in
+        if img_tags:
+            for matches in _GALLERY_IMG_FILTERS:
+                for img in img_tags:
+                    if not matches(img):
+                        continue
                     for attr in ['data-zoom', 'data-src', 'src']:
                         val = img.get(attr, '')
                         if 'mlstatic' in val:
@@ -471,8 +884,8 @@ class MercadoLibreScraper(BaseScraper):
                             break
 
         # Strategy 4: Search all img tags with mlstatic
-        if not images and self.soup:
-            for img in self.soup.find_all('img'):
+        if not images:
+            for img in img_tags:
                 for attr in ['data-src', 'src']:
                     val = img.get(attr, '')
                     if 'http2.mlstatic.com' in val and '/D_' in val:
@@ -556,76 +969,37 @@ class MercadoLibreScraper(BaseScraper):
             for item in items:
                 spec_items.append(item.get_text(' ', strip=True).lower())
 
+        # Only fields the API left empty are matched; stop once all are filled
+        pending = [spec for spec in _SPEC_FIELDS if features[spec[0]] is None]
         for item in spec_items:
-            if features['total_area'] is None and ('superficie total' in item or 'sup. total' in item):
-                m = re.search(r'(\d+(?:[.,]\d+)?)', item)
-                if m:
-                    features['total_area'] = float(m.group(1).replace(',', '.'))
-
-            if features['covered_area'] is None and ('superficie cubierta' in item or 'sup. cubierta' in item or 'cubiertos' in item):
-                m = re.search(r'(\d+(?:[.,]\d+)?)', item)
-                if m:
-                    features['covered_area'] = float(m.group(1).replace(',', '.'))
-
-            if features['bedrooms'] is None and ('dormitorio' in item or 'habitaci' in item):
-                m = re.search(r'(\d+)', item)
-                if m:
-                    features['bedrooms'] = int(m.group(1))
-
-            if features['bedrooms'] is None and 'ambiente' in item:
-                m = re.search(r'(\d+)', item)
-                if m:
-                    features['bedrooms'] = int(m.group(1))
-
-            if features['bathrooms'] is None and 'baño' in item:
-                m = re.search(r'(\d+)', item)
-                if m:
-                    features['bathrooms'] = int(m.group(1))
-
-            if features['parking_spaces'] is None and ('cochera' in item or 'estacionamiento' in item):
-                m = re.search(r'(\d+)', item)
-                if m:
-                    features['parking_spaces'] = int(m.group(1))
+            if not pending:
+                break
+            for field, keywords, number_re, cast in pending:
+                if any(keyword in item for keyword in keywords):
+                    m = number_re.search(item)
+                    if m:
+                        features[field] = cast(m.group(1).replace(',', '.'))
+            pending = [spec for spec in pending if features[spec[0]] is None]
 
         # Strategy 3: Full page text regex fallback
         if not any([features['total_area'], features['covered_area'], features['bedrooms']]):
-            text = self.soup.get_text()
-
-            if features['bedrooms'] is None:
-                bed_match = re.search(r'(\d+)\s*dormitorio|(\d+)\s*ambiente', text, re.IGNORECASE)
-                if bed_match:
-                    features['bedrooms'] = int(bed_match.group(1) or bed_match.group(2))
-
-            if features['bathrooms'] is None:
-                bath_match = re.search(r'(\d+)\s*baño', text, re.IGNORECASE)
-                if bath_match:
-                    features['bathrooms'] = int(bath_match.group(1))
-
-            if features['parking_spaces'] is None:
-                parking_match = re.search(r'(\d+)\s*cochera', text, re.IGNORECASE)
-                if parking_match:
-                    features['parking_spaces'] = int(parking_match.group(1))
-
-            if features['total_area'] is None:
-                area_match = re.search(r'(\d+(?:[.,]\d+)?)\s*m[²2]?\s*totales?', text, re.IGNORECASE)
-                if area_match:
-                    features['total_area'] = float(area_match.group(1).replace(',', '.'))
-
-            if features['covered_area'] is None:
-                area_cub_match = re.search(r'(\d+(?:[.,]\d+)?)\s*m[²2]?\s*cubiertos?', text, re.IGNORECASE)
-                if area_cub_match:
-                    features['covered_area'] = float(area_cub_match.group(1).replace(',', '.'))
+            missing = {field for field in _RE_TEXT_FEATURES.groupindex if features[field] is None}
+            for match in _RE_TEXT_FEATURES.finditer(self._get_page_text_lower()):
+                if not missing:
+                    break
+                field = match.lastgroup
+                if field not in missing:
+                    continue
+                value = match.group(field)
+                if field in _TEXT_AREA_FIELDS:
+                    features[field] = float(value.replace(',', '.'))
+                else:
+                    features[field] = int(value)
+                missing.discard(field)
 
         # Extract amenities from description
-        amenities = []
-        amenity_keywords = [
-            'pileta', 'piscina', 'gimnasio', 'seguridad', 'parrilla',
-            'balcón', 'terraza', 'jardín', 'quincho', 'sum', 'laundry'
-        ]
         description = self._extract_description().lower()
-        for keyword in amenity_keywords:
-            if keyword in description:
-                amenities.append(keyword)
+        amenities = [keyword for keyword in _AMENITY_KEYWORDS if keyword in description]
 
         features['amenities'] = amenities
 
@@ -641,7 +1015,7 @@ class MercadoLibreScraper(BaseScraper):
 
     def _extract_source_id(self) -> str:
         """Extract property ID from URL"""
-        match = re.search(r'MLA-?(\d+)', self.url)
+        match = _RE_MLA_ID.search(self.url)
         if match:
             return f"MLA{match.group(1)}"
 
@@ -671,48 +1045,27 @@ class MercadoLibreScraper(BaseScraper):
 
         # Strategy 3: page text keywords
         if self.soup:
-            page_text = self.soup.get_text().lower()
-
-            removed_keywords = [
-                'finalizada', 'finalizó', 'finalizo',
-                'publicación ya finalizó', 'publicacion ya finalizo',
-                'esta publicación finalizó', 'vencida',
-            ]
-            sold_keywords = ['vendido', 'vendida', 'sold', 'no disponible', 'pausado']
-            rented_keywords = ['alquilado', 'alquilada', 'rented']
-            reserved_keywords = ['reservado', 'reservada', 'reserved']
-
-            for keyword in removed_keywords:
-                if keyword in page_text:
-                    return "removed"
-
-            for keyword in sold_keywords:
-                if keyword in page_text[:500]:
-                    return "sold"
-            for keyword in rented_keywords:
-                if keyword in page_text[:500]:
-                    return "rented"
-            for keyword in reserved_keywords:
-                if keyword in page_text[:500]:
-                    return "reserved"
-
-            status_selectors = [
-                '.ui-pdp-header__status',
-                '[class*="status"]',
-                '.ui-pdp-badge',
-            ]
-            for selector in status_selectors:
+            page_text = self._get_page_text_lower()
+            if any(k in page_text for k in _REMOVED_KEYWORDS):
+                return "removed"
+
+            head_text = page_text[:_STATUS_HEAD_CHARS]
+            if any(k in head_text for k in _SOLD_KEYWORDS):
+                return "sold"
+            if any(k in head_text for k in _RENTED_KEYWORDS):
+                return "rented"
+            if any(k in head_text for k in _RESERVED_KEYWORDS):
+                return "reserved"
+
+            for selector in _STATUS_SELECTORS:
                 status_elem = self.soup.select_one(selector)
                 if status_elem:
                     status_text = status_elem.get_text().lower()
-                    for keyword in removed_keywords:
-                        if keyword in status_text:
-                            return "removed"
-                    for keyword in sold_keywords:
-                        if keyword in status_text:
-                            return "sold"
-                    for keyword in reserved_keywords:
-                        if keyword in status_text:
-                            return "reserved"
+                    if any(k in status_text for k in _REMOVED_KEYWORDS):
+                        return "removed"
+                    if any(k in status_text for k in _SOLD_KEYWORDS):
+                        return "sold"
+                    if any(k in status_text for k in _RESERVED_KEYWORDS):
+                        return "reserved"
 
         return "active"
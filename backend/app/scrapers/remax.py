@@ -21,6 +21,8 @@ class RemaxScraper(BaseScraper):
     IMAGE_RESOLUTION = "1080xAUTO"
     IMAGE_EXTENSION = ".jpg"
 
+    __slots__ = ()
+
     def validate_url(self) -> bool:
         """Check if URL is from Remax"""
         parsed = urlparse(self.url)
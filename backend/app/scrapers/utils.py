@@ -1,12 +1,140 @@
 """
 Shared utilities for scrapers.
 """
+import asyncio
 import re
+import time
 import logging
-from typing import Optional, Tuple
+import threading
+from typing import Dict, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
+# Fastest available BeautifulSoup tree builder (lxml is libxml2-backed)
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+
+# Fastest available JSON decoder (orjson is a Rust parser). orjson.JSONDecodeError
+# subclasses json.JSONDecodeError, so callers catch the same exception either way.
+try:
+    from orjson import loads as json_loads  # noqa: F401
+except ImportError:
+    from json import loads as json_loads  # noqa: F401
+
+# Requests a scraping browser never needs (CDP Network.setBlockedURLs patterns):
+# extraction only reads the DOM, so images, fonts, media and trackers are blocked.
+# Scrapers extend a copy with what else their pages can skip.
+BLOCKED_RESOURCE_URLS = [
+    '*.jpg', '*.jpeg', '*.png', '*.webp', '*.gif', '*.svg',
+    '*.woff', '*.woff2', '*.ttf', '*.mp4',
+    '*googletagmanager*', '*google-analytics*', '*doubleclick*', '*facebook.net*', '*hotjar*',
+]
+
+
+class RateLimiter:
+    """
+    Thread-safe, adaptive token bucket.
+
+    Allows bursts of up to ``capacity`` calls and refills at ``rate``
+    tokens per second. ``acquire()`` blocks until a token is available.
+    When the server pushes back, ``penalize()`` pauses every caller and
+    halves the rate; ``reward()`` creeps it back toward the configured rate.
+    """
+
+    def __init__(self, rate: float, capacity: float, min_rate: Optional[float] = None):
+        self.max_rate = rate
+        self.min_rate = min_rate or rate / 8
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Take one token, sleeping until the bucket has refilled if needed."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                if now < self._updated:
+                    # Paused by penalize()
+                    wait = self._updated - now
+                else:
+                    self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                    self._updated = now
+                    if self._tokens >= 1:
+                        self._tokens -= 1
+                        return
+                    wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+    def penalize(self, pause: float) -> None:
+        """Server pushed back (e.g. 429/503): pause all callers and halve the rate."""
+        with self._lock:
+            self.rate = max(self.min_rate, self.rate / 2)
+            self._tokens = 0
+            self._updated = max(self._updated, time.monotonic() + pause)
+
+    def reward(self) -> None:
+        """Successful response: raise the rate 10%, up to the configured maximum."""
+        with self._lock:
+            self.rate = min(self.max_rate, self.rate * 1.1)
+
+
+class DomainRateLimiter:
+    """
+    Adaptive minimum interval between requests to the same domain.
+
+    ``acquire()`` reserves the domain's next free slot and sleeps only for
+    the time left until it, so a slow fetch is not followed by a full extra
+    delay. ``back_off()`` widens the interval (block, 429, error) up to
+    ``cap``; ``ok()`` decays it back toward the caller's floor. Slots are
+    reserved under a thread lock, so one instance can be shared by scrapers
+    running on different event loops.
+    """
+
+    def __init__(self, cap: float = 15.0, factor: float = 1.5, decay: float = 0.8):
+        self.cap = cap
+        self.factor = factor
+        self.decay = decay
+        # domain -> [next free slot (monotonic), current interval, floor]
+        self._domains: Dict[str, List[float]] = {}
+        self._lock = threading.Lock()
+
+    async def acquire(self, domain: str, min_interval: float) -> None:
+        """Wait for the next slot for domain, at least min_interval after the last one."""
+        with self._lock:
+            now = time.monotonic()
+            state = self._domains.get(domain)
+            if state is None:
+                state = self._domains[domain] = [now, min_interval, min_interval]
+            state[2] = min_interval
+            state[1] = max(state[1], min_interval)
+            slot = max(now, state[0])
+            state[0] = slot + state[1]
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+    def back_off(self, domain: str) -> None:
+        """The domain pushed back: widen its interval by ``factor`` (up to ``cap``)."""
+        with self._lock:
+            state = self._domains.get(domain)
+            if state is not None:
+                state[1] = min(self.cap, state[1] * self.factor)
+
+    def ok(self, domain: str) -> None:
+        """Successful request: decay the interval toward the domain's floor."""
+        with self._lock:
+            state = self._domains.get(domain)
+            if state is not None:
+                state[1] = max(state[2], state[1] * self.decay)
+
+
+# Numeric run in a price string (digits with '.'/',' separators)
+_RE_PRICE_NUMBER = re.compile(r'[\d.,]+')
+
 
 def clean_price(price_text: str) -> Tuple[Optional[float], Optional[str]]:
     """
@@ -43,13 +171,13 @@ def clean_price(price_text: str) -> Tuple[Optional[float], Optional[str]]:
         # Bare "$" -> ARS in Argentina context
         currency = "ARS"
 
-    # Extract numeric portions (digits, dots, commas)
-    numbers = re.findall(r'[\d.,]+', text)
-    if not numbers:
+    # First numeric portion (digits, dots, commas)
+    number = _RE_PRICE_NUMBER.search(text)
+    if not number:
         return None, currency
 
-    # Take the first number and clean it
-    price_str = numbers[0]
+    # Clean it
+    price_str = number.group()
 
     # Handle different number formats:
     if price_str.count('.') > 1:
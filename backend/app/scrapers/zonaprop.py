@@ -7,6 +7,7 @@ import asyncio
 import re
 import json
 import logging
+import threading
 from typing import Dict, Any, List, Optional
 from urllib.parse import urlparse, urljoin
 from bs4 import BeautifulSoup
@@ -16,12 +17,23 @@ from .utils import clean_price as _clean_price
 
 logger = logging.getLogger(__name__)
 
+# Chrome instances the Selenium fallback may run at once in this process. Bulk
+# re-scrapes run several listings concurrently, and asyncio.wait_for cannot
+# stop the worker thread, so each thread holds its slot until Chrome has quit.
+SELENIUM_MAX_BROWSERS = 2
+# A thread still queued after this long gives up instead of launching Chrome
+# for a caller that has most likely timed out already
+SELENIUM_SLOT_TIMEOUT = 30
+_selenium_slots = threading.BoundedSemaphore(SELENIUM_MAX_BROWSERS)
+
 
 class ZonapropScraper(BaseScraper):
     """Scraper for Zonaprop portal. Uses curl_cffi for Cloudflare bypass, Selenium as last resort."""
 
     DOMAIN = "zonaprop.com.ar"
 
+    __slots__ = ()
+
     def validate_url(self) -> bool:
         """Check if URL is from Zonaprop"""
         parsed = urlparse(self.url)
@@ -74,6 +86,9 @@ class ZonapropScraper(BaseScraper):
         chrome_options.add_experimental_option('excludeSwitches', ['enable-automation'])
         chrome_options.add_experimental_option('useAutomationExtension', False)
 
+        if not _selenium_slots.acquire(timeout=SELENIUM_SLOT_TIMEOUT):
+            raise RuntimeError("[zonaprop] No Selenium slot free, skipping browser fallback")
+
         driver = None
         try:
             driver = webdriver.Chrome(options=chrome_options)
@@ -104,8 +119,11 @@ class ZonapropScraper(BaseScraper):
             return html
 
         finally:
-            if driver:
-                driver.quit()
+            try:
+                if driver:
+                    driver.quit()
+            finally:
+                _selenium_slots.release()
 
     def extract_data(self) -> Dict[str, Any]:
         """Extract all property data from Zonaprop"""
@@ -564,10 +582,12 @@ class ZonapropScraper(BaseScraper):
 
     def _extract_images(self) -> List[str]:
         """Extract image URLs"""
-        images = []
+        # Insertion-ordered dict as an ordered set: dedups as it goes, so the
+        # HTML fallback can stop as soon as the 20 kept images are known
+        images: Dict[str, None] = {}
 
         if not self.soup:
-            return images
+            return []
 
         # Strategy 1: JSON-LD structured data (most reliable for Zonaprop)
         scripts = self.soup.find_all('script', type='application/ld+json')
@@ -581,11 +601,11 @@ class ZonapropScraper(BaseScraper):
                             for img_url in img_data:
                                 normalized = self._normalize_image_url(img_url)
                                 if normalized and self._is_valid_property_image(normalized):
-                                    images.append(normalized)
+                                    images[normalized] = None
                         elif isinstance(img_data, str):
                             normalized = self._normalize_image_url(img_data)
                             if normalized and self._is_valid_property_image(normalized):
-                                images.append(normalized)
+                                images[normalized] = None
             except (json.JSONDecodeError, AttributeError):
                 continue
 
@@ -602,6 +622,8 @@ class ZonapropScraper(BaseScraper):
             ]
 
             for selector in selectors:
+                if len(images) >= 20:
+                    break
                 imgs = self.soup.select(selector)
                 for img in imgs:
                     for attr in image_attrs:
@@ -609,18 +631,10 @@ class ZonapropScraper(BaseScraper):
                         if img_url:
                             normalized = self._normalize_image_url(img_url)
                             if normalized and self._is_valid_property_image(normalized):
-                                images.append(normalized)
+                                images[normalized] = None
                             break
 
-        # Remove duplicates while preserving order
-        seen = set()
-        unique_images = []
-        for img in images:
-            if img not in seen:
-                seen.add(img)
-                unique_images.append(img)
-
-        return unique_images[:20]
+        return list(images)[:20]
 
     def _is_valid_property_image(self, url: str) -> bool:
         """Check if URL is a valid property image (not icon/logo/svg)"""